@@ -21,6 +21,7 @@ class BackgroundEffects:
         self.circles = []
         self.counter = 0
         self.dest_surf = pygame.Surface((utils.world_size[0], utils.world_size[1]), pygame.SRCALPHA).convert_alpha()
+        self.rects = []  # parts of the screen covered by circles, as of last render
 
     def update(self):
         if self.counter == 3:
@@ -41,9 +42,27 @@ class BackgroundEffects:
         width = random.randint(0, 25)
         self.circles.append(self.Circle(radius, color, x, y, width))
 
-    def draw(self, surface):
+    def render(self):
+        """Draws circles at quarter resolution and returns parts of the screen they cover"""
         self.surface.fill((0, 0, 0, 0))
+        self.rects = []
         for circle in self.circles:
-            pygame.draw.circle(self.surface, circle.color, (circle.x, circle.y), circle.radius, circle.width)
-        surface.blit(pygame.transform.scale(self.surface, (utils.world_size[0], utils.world_size[1]), self.dest_surf),
-                     (0, 0))
+            rect = pygame.draw.circle(self.surface, circle.color, (circle.x, circle.y), circle.radius, circle.width)
+            self.rects.append(pygame.Rect(rect.x * 4, rect.y * 4, rect.width * 4, rect.height * 4))
+        return self.rects
+
+    def draw(self, surface, rects=None):
+        """Scales rendered circles onto surface, only inside rects if given"""
+        if rects is None:
+            surface.blit(pygame.transform.scale(self.surface, (utils.world_size[0], utils.world_size[1]),
+                                                self.dest_surf), (0, 0))
+            return
+        bounds = self.surface.get_rect()
+        for rect in rects:
+            if rect.collidelist(self.rects) == -1:
+                continue
+            left, top = rect.left // 4, rect.top // 4
+            area = pygame.Rect(left, top, -(-rect.right // 4) - left, -(-rect.bottom // 4) - top).clip(bounds)
+            if area:
+                scaled = pygame.transform.scale(self.surface.subsurface(area), (area.width * 4, area.height * 4))
+                surface.blit(scaled, rect, rect.move(-area.x * 4, -area.y * 4))
@@ -1,80 +1,124 @@
 import math
+import numpy
 import pygame
 import random
 from src.particles import EnemyHitParticle, WallHitParticle, StaffParticle
 
 
 class Bullet():
-    def __init__(self, game, master, room, x, y, target):
-        super().__init__()
+    """Pooled by BulletManager, position, direction, speed and damage live in the manager's arrays at self.slot"""
+    image = None
+    mask = None
+
+    def __init__(self, game):
         self.game = game
+        self.manager = game.bullet_manager
+        self.slot = None
+        self.master = None
+        self.room = None
+        self.bounce_back = True
+        self.load_image()
+        self.rect = self.image.get_rect()
+
+    @classmethod
+    def load_image(cls):
+        """Image and mask are shared by all bullets of a class"""
+        if 'image' not in cls.__dict__:
+            cls.image = pygame.Surface([cls.bullet_size, cls.bullet_size])
+            cls.image.fill((255, 255, 255))
+            cls.mask = pygame.mask.from_surface(cls.image)
+
+    def spawn(self, slot, master, room, x, y, target, rotation=None):
+        self.slot = slot
         self.master = master
         self.room = room
-        self.image = None
-        self.rect = None
-        self.load_image()
         self.rect.x = x
         self.rect.y = y
         self.pos = (x, y)
-        self.dir = pygame.math.Vector2(target[0] - x, target[1] - y)
-        self.calculate_dir()
+        self.dir = self.calculate_dir(target[0] - x, target[1] - y, rotation)
+        self.speed = self.default_speed
         self.bounce_back = True
 
-    def calculate_dir(self):
-        length = math.hypot(*self.dir)
-        self.dir = pygame.math.Vector2(self.dir[0] / length, self.dir[1] / length)
+    @staticmethod
+    def calculate_dir(x, y, rotation=None):
+        length = math.hypot(x, y) or 1
+        x, y = x / length, y / length
+        if rotation:
+            angle = math.radians(rotation)
+            x, y = x * math.cos(angle) - y * math.sin(angle), x * math.sin(angle) + y * math.cos(angle)
+        return x, y
+
+    @property
+    def pos(self):
+        return self.manager.pos[self.slot]
 
-    def set_damage(self, value):
-        self.damage = value
+    @pos.setter
+    def pos(self, value):
+        self.manager.pos[self.slot] = value
 
-    def load_image(self):
-        self.image = pygame.Surface([self.bullet_size, self.bullet_size])
-        self.image.fill((255, 255, 255))
-        self.rect = self.image.get_rect()
+    @property
+    def dir(self):
+        return self.manager.dir[self.slot]
+
+    @dir.setter
+    def dir(self, value):
+        self.manager.dir[self.slot] = value
 
-    def update_position(self):
-        if self.room == self.game.world_manager.current_room:
-            self.pos = (self.pos[0] + self.dir[0] * self.speed,
-                        self.pos[1] + self.dir[1] * self.speed)
+    @property
+    def speed(self):
+        return self.manager.speed[self.slot]
 
-            self.rect.x = self.pos[0]  #
-            self.rect.y = self.pos[1]  #
+    @speed.setter
+    def speed(self, value):
+        self.manager.speed[self.slot] = value
+
+    @property
+    def damage(self):
+        return float(self.manager.damage[self.slot])
+
+    @damage.setter
+    def damage(self, value):
+        self.manager.damage[self.slot] = value
+
+    def set_damage(self, value):
+        self.damage = value
 
     def kill(self):
-        if self in self.game.bullet_manager.bullets:
-            self.game.bullet_manager.bullets.remove(self)
-        self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/Impact5.wav'))
+        self.manager.release(self)
+        self.game.sound_manager.play('bullet_impact')
 
     def update(self):
-        self.update_position()
-        if self.bounce_back is False:
-            for enemy in self.game.enemy_manager.enemy_list:
-                if self.rect.colliderect(enemy.hitbox):
-                    enemy.hp -= self.damage
-                    self.game.particle_manager.particle_list.append(
-                        EnemyHitParticle(self.game, self.rect.x, self.rect.y))
-                    self.kill()
-                    break
-        self.player_collision(self.game.player)
+        """Called after BulletManager moved the bullet, stops as soon as the bullet gets killed"""
+        if self.bounce_back is False and self.hit_enemy():
+            return
+        if self.player_collision(self.game.player):
+            return
         self.bounce()
         if self.rect.y < 0 or self.rect.y > 1000 or self.rect.x < 0 or self.rect.x > 1300:
             self.kill()
+            return
         self.wall_collision()
 
+    def hit_enemy(self):
+        for enemy in self.game.enemy_manager.nearby_enemies(self.rect):
+            if self.rect.colliderect(enemy.hitbox):
+                enemy.hp -= self.damage
+                self.game.particle_manager.add_particle(EnemyHitParticle(self.game, self.rect.x, self.rect.y))
+                self.kill()
+                return True
+
     def draw(self):
-        surface = self.master.room.tile_map.map_surface
-        pygame.draw.circle(surface, (255, 255, 255), (self.rect.x + self.radius / 2, self.rect.y + self.radius / 2),
-                           self.radius)
-        pygame.draw.circle(surface, (58, 189, 74), (self.rect.x + self.radius / 2, self.rect.y + self.radius / 2),
-                           self.radius - 1)
+        tile_map = self.master.room.tile_map
+        center = (self.rect.x + self.radius / 2, self.rect.y + self.radius / 2)
+        tile_map.add_dirty_rect(pygame.draw.circle(tile_map.map_surface, (255, 255, 255), center, self.radius))
+        pygame.draw.circle(tile_map.map_surface, (58, 189, 74), center, self.radius - 1)
 
     def wall_collision(self):
         collide_points = (self.rect.midbottom, self.rect.bottomleft, self.rect.bottomright)
-        for wall in self.game.world_manager.current_map.wall_list:
-            if any(wall.hitbox.collidepoint(point) for point in collide_points):
-                self.game.particle_manager.add_particle(WallHitParticle(self.game, self.rect.x, self.rect.y))
-                self.kill()
-                break
+        if self.game.world_manager.current_map.wall_collision(collide_points):
+            self.game.particle_manager.add_particle(WallHitParticle(self.game, self.rect.x, self.rect.y))
+            self.kill()
+            return True
 
     def player_collision(self, collision_enemy):
         if self.rect.colliderect(collision_enemy.hitbox) and not self.game.world_manager.switch_room:
@@ -86,10 +130,11 @@ class Bullet():
                 self.game.player.entity_animation.hurt_timer = pygame.time.get_ticks()
             self.sparkle()
             self.kill()
+            return True
 
     def sparkle(self):
         for _ in range(random.randint(2, 4)):
-            self.game.particle_manager.particle_list.append(EnemyHitParticle(self.game, self.rect.x, self.rect.y))
+            self.game.particle_manager.add_particle(EnemyHitParticle(self.game, self.rect.x, self.rect.y))
 
     def bounce(self):
         if (
@@ -101,48 +146,48 @@ class Bullet():
             self.dir = (-self.dir[0] + random.randint(-20, 10) / 100, -self.dir[1] + random.randint(-10, 10) / 100)
             self.speed *= random.randint(10, 20) / 10
             self.bounce_back = False
-            self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/Hit.wav'))
+            self.game.sound_manager.play('bounce')
 
 
 class ImpBullet(Bullet):
-    speed = 5
+    default_speed = 5
     bullet_size = 7
     radius = 5
 
-    def __init__(self, game, master, room, x, y, target):
-        super().__init__(game, master, room, x, y, target)
+    def spawn(self, slot, master, room, x, y, target, rotation=None):
+        super().spawn(slot, master, room, x, y, target, rotation)
         self.damage = master.damage
 
 
 class StaffBullet(Bullet):
-    speed = 9
+    default_speed = 9
     bullet_size = 12
     radius = 7
 
-    def __init__(self, game, master, room, x, y, target):
-        super().__init__(game, master, room, x, y, target)
+    def spawn(self, slot, master, room, x, y, target, rotation=None):
+        super().spawn(slot, master, room, x, y, target, rotation)
         self.damage = 35 * self.game.player.strength
         self.bounce_back = False
 
     def sparkle(self):
         for _ in range(random.randint(2, 4)):
-            self.game.particle_manager.particle_list.append(
+            self.game.particle_manager.add_particle(
                 StaffParticle(self.game, self.rect.x, self.rect.y, self.room))
 
     def hit_enemy(self):
-        for enemy in self.game.enemy_manager.enemy_list:
+        for enemy in self.game.enemy_manager.nearby_enemies(self.rect):
             if self.rect.colliderect(enemy.hitbox) and enemy.can_get_hurt_from_weapon():
                 enemy.hp -= self.damage
                 enemy.entity_animation.hurt_timer = pygame.time.get_ticks()
                 enemy.hurt = True
                 enemy.weapon_hurt_cooldown = pygame.time.get_ticks()
-                self.game.particle_manager.particle_list.append(
+                self.game.particle_manager.add_particle(
                     EnemyHitParticle(self.game, self.rect.x, self.rect.y))
                 # self.kill()
 
     def update(self):
-        self.wall_collision()
-        self.update_position()
+        if self.wall_collision():
+            return
         self.sparkle()
         self.hit_enemy()
         if self.rect.y < 0 or self.rect.y > 1000 or self.rect.x < 0 or self.rect.x > 1400:
@@ -150,64 +195,110 @@ class StaffBullet(Bullet):
 
     def draw(self):
         # surface = self.game.world_manager.current_map.map_surface
-        surface = self.room.tile_map.map_surface
-        pygame.draw.circle(surface, (255, 255, 255), (self.rect.x + self.radius / 2, self.rect.y + self.radius / 2),
-                           self.radius)
-        pygame.draw.circle(surface, (151, 218, 63), (self.rect.x + self.radius / 2, self.rect.y + self.radius / 2),
-                           self.radius - 1)
+        tile_map = self.room.tile_map
+        center = (self.rect.x + self.radius / 2, self.rect.y + self.radius / 2)
+        tile_map.add_dirty_rect(pygame.draw.circle(tile_map.map_surface, (255, 255, 255), center, self.radius))
+        pygame.draw.circle(tile_map.map_surface, (151, 218, 63), center, self.radius - 1)
 
 
 class BossBullet(Bullet):
-    speed = 7
+    default_speed = 7
     bullet_size = 7
     radius = 5
 
-    def __init__(self, game, master, room, x, y, target, rotation=None):
-        super().__init__(game, master, room, x, y, target)
-        if rotation:
-            self.dir.rotate_ip(rotation)
+    def spawn(self, slot, master, room, x, y, target, rotation=None):
+        super().spawn(slot, master, room, x, y, target, rotation)
         self.damage = master.bullet_damage
 
     def kill(self):
-        if self in self.game.bullet_manager.bullets:
-            self.game.bullet_manager.bullets.remove(self)
+        self.manager.release(self)
 
 
 class MachineGunBullet(BossBullet):
 
-    def __init__(self, game, master, room, x, y, target, rotation=None):
-        super().__init__(game, master, room, x, y, target)
-
     def update(self):
-        self.update_position()
-        self.player_collision(self.game.player)
+        if self.player_collision(self.game.player):
+            return
         if self.rect.y < 0 or self.rect.y > 1000 or self.rect.x < 0 or self.rect.x > 1300:
             self.kill()
+            return
         self.wall_collision()
 
 
 class BulletManager:
+    """Keeps kinematics of all bullets in preallocated arrays and reuses released bullets and slots"""
 
-    def __init__(self, game):
+    def __init__(self, game, capacity=256):
         self.game = game
         self.bullets = []
+        self.pools = {}  # bullet class: released bullets ready to be spawned again
+        self.capacity = capacity
+        self.pos = numpy.zeros((capacity, 2))
+        self.dir = numpy.zeros((capacity, 2))
+        self.speed = numpy.zeros(capacity)
+        self.damage = numpy.zeros(capacity)
+        self.active = numpy.zeros(capacity, dtype=bool)
+        self.free_slots = list(range(capacity - 1, -1, -1))
+
+    def grow(self):
+        self.free_slots.extend(range(2 * self.capacity - 1, self.capacity - 1, -1))
+        self.capacity *= 2
+        for name in ('pos', 'dir', 'speed', 'damage', 'active'):
+            array = getattr(self, name)
+            grown = numpy.zeros((self.capacity,) + array.shape[1:], dtype=array.dtype)
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def add_bullet(self, bullet_class, master, room, x, y, target, rotation=None):
+        pool = self.pools.get(bullet_class)
+        bullet = pool.pop() if pool else bullet_class(self.game)
+        if not self.free_slots:
+            self.grow()
+        slot = self.free_slots.pop()
+        self.active[slot] = True
+        bullet.spawn(slot, master, room, x, y, target, rotation)
+        self.bullets.append(bullet)
+        return bullet
+
+    def release(self, bullet):
+        """Frees bullet's slot, the bullet itself returns to its pool at the end of update"""
+        if bullet.slot is None:
+            return
+        self.active[bullet.slot] = False
+        self.free_slots.append(bullet.slot)
+        bullet.slot = None
 
     def remove_bullets(self):
         for bullet in self.bullets:
             if self.game.world_manager.current_room is not bullet.room:
-                self.bullets.remove(bullet)
-                #self.kill(bullet)
+                self.release(bullet)
 
-    def add_bullet(self, bullet):
-        self.bullets.append(bullet)
+    def collect_released(self):
+        if all(bullet.slot is not None for bullet in self.bullets):
+            return
+        alive = []
+        for bullet in self.bullets:
+            if bullet.slot is None:
+                self.pools.setdefault(type(bullet), []).append(bullet)
+            else:
+                alive.append(bullet)
+        self.bullets = alive
 
-    def kill(self, bullet):
-        self.bullets.remove(bullet)
+    def move_bullets(self):
+        active = self.active
+        self.pos[active] += self.dir[active] * self.speed[active, None]
+        positions = self.pos.astype(int).tolist()
+        for bullet in self.bullets:
+            if bullet.slot is not None:
+                bullet.rect.topleft = positions[bullet.slot]
 
     def update(self):
         self.remove_bullets()
+        self.move_bullets()
         for bullet in self.bullets:
-            bullet.update()
+            if bullet.slot is not None:
+                bullet.update()
+        self.collect_released()
 
     def draw(self):
         for bullet in self.bullets:
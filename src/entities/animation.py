@@ -3,19 +3,35 @@ import pygame
 import src.utils as utils
 
 
-def load_animation_sprites(path, size=utils.basic_entity_size):
-    """Loads animation frames(.png files) from specified directory to a dictionary"""
+animation_cache = {}  # (path, size) -> animation frames shared by every entity of that character
+
 
+def read_animation_sprites(path, size):
+    """Loads animation frames(.png files) from specified directory to a dictionary, for both facing directions"""
     animation_data = {"IDLE": [], "WALK": [], "RUN": [], 'HURT': [], 'DEAD': []}
     animation_states = os.listdir(path)  # Lists all the subdirectories in specified path
     for state in animation_states:
-        sub_states = os.listdir(path + state)
+        sub_states = sorted(os.listdir(path + state))
         for sub_state in sub_states:
             key = state.upper()  # key to dictionary
             animation_image = pygame.image.load(path + state + '/' + sub_state).convert_alpha()
             animation_image = pygame.transform.scale(animation_image, size)
             animation_data[key].append(animation_image)
-    return animation_data
+    left = {key: tuple(frames) for key, frames in animation_data.items()}
+    right = {key: tuple(pygame.transform.flip(frame, 1, 0) for frame in frames) for key, frames in left.items()}
+    for bank in (left, right):  # hitbox of every frame is known before the first update
+        for frames in bank.values():
+            for frame in frames:
+                utils.get_cached_mask_rect(frame)
+    return {'left': left, 'right': right}
+
+
+def load_animation_sprites(path, size=utils.basic_entity_size):
+    """Returns animation frames of a character, frames are read from disk only once per (path, size)"""
+    key = (path, tuple(size))
+    if key not in animation_cache:
+        animation_cache[key] = read_animation_sprites(path, size)
+    return animation_cache[key]
 
 
 class EntityAnimation:
@@ -43,11 +59,7 @@ class EntityAnimation:
         """Animation if idle"""
         self.update_animation_frame()
         self.get_direction()
-        if self.animation_direction == 'left':
-            self.entity.image = self.entity.animation_database[state][int(self.animation_frame)]
-        elif self.animation_direction == 'right':
-            self.entity.image = self.entity.animation_database[state][int(self.animation_frame)]
-            self.entity.image = pygame.transform.flip(self.entity.image, 1, 0)
+        self.entity.image = self.entity.animation_database[self.animation_direction][state][int(self.animation_frame)]
 
     def death_animation(self):
         self.animation_frame += 1.0 / self.speed
@@ -55,11 +67,9 @@ class EntityAnimation:
             self.entity.death_counter = 0
         if self.animation_frame <= self.death_animation_frames:
             state = 'HURT' if self.animation_frame < 1 else 'DEAD'
-            if self.entity.direction == 'left':
-                self.entity.image = self.entity.animation_database[state][int(self.animation_frame)]
-            elif self.entity.direction == 'right':
-                self.entity.image = self.entity.animation_database[state][int(self.animation_frame)]
-                self.entity.image = pygame.transform.flip(self.entity.image, 1, 0)
+            if self.entity.direction in ('left', 'right'):
+                frames = self.entity.animation_database[self.entity.direction][state]
+                self.entity.image = frames[int(self.animation_frame)]
 
     def hurt_animation(self):
         self.animation_frame = 0
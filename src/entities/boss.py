@@ -5,6 +5,7 @@ from src.particles import DeathAnimation
 from src.bullet import BossBullet, MachineGunBullet
 from src.objects.flask import RedFlask, GreenFlask
 from src.objects.coin import Coin
+from src.objects.treasure import Treasure
 from src.entities.animation import EntityAnimation, load_animation_sprites
 from src.entities.enemy import Enemy
 
@@ -18,18 +19,17 @@ class Boss(Enemy):
     speed = 14
     size = (96, 96)
 
-    def __init__(self, game, room):
+    def __init__(self, game, room, level):
         super().__init__(game, max_hp=self.max_hp, room=room, name=self.name)
         self.room = room
-        self.image = pygame.transform.scale(pygame.image.load(f'./assets/characters/{self.name}/idle/idle0.png'),
-                                            self.size).convert_alpha()
+        self.animation_database = load_animation_sprites(f'./assets/characters/{self.name}/', self.size)
+        self.image = self.animation_database['left']['IDLE'][0]
         self.rect = self.image.get_rect(center=(512, 400))
         self.rect.midbottom = (21 * 64 / 2, 7.25 * 64)
         self.bullets = pygame.sprite.Group()
-        self.shooter = Shooting(self)
-        self.animation_database = load_animation_sprites(f'./assets/characters/{self.name}/', self.size)
+        self.shooter = Shooting(self, level)
         self.entity_animation = EntityAnimation(self, 8, 10)
-        self.items = [RedFlask(self.game, self.room)]
+        self.items = [Treasure(RedFlask)]
         self.add_treasure()
 
     def spawn(self):
@@ -72,15 +72,16 @@ class Boss(Enemy):
             self.game.particle_manager.add_particle(DeathAnimation(self.game, *position, self))
 
     def draw(self):
-        self.draw_shadow(self.room.tile_map.map_surface, size=(0, 0, 30, 14), dimension=100, vertical_shift=-10,
-                         horizontal_shift=3)
-        self.room.tile_map.map_surface.blit(self.image, self.rect)
-        self.draw_health(self.room.tile_map.map_surface)
+        tile_map = self.room.tile_map
+        tile_map.add_dirty_rect(self.draw_shadow(tile_map.map_surface, size=(0, 0, 30, 14), dimension=100,
+                                                 vertical_shift=-10, horizontal_shift=3))
+        tile_map.add_dirty_rect(tile_map.map_surface.blit(self.image, self.interpolated_rect()))
+        tile_map.add_dirty_rect(self.draw_health(tile_map.map_surface))
 
 
 class Shooting:
 
-    def __init__(self, boss):
+    def __init__(self, boss, level):
         self.boss = boss
         self.game = self.boss.game
         self.shoot_time = 0
@@ -89,7 +90,7 @@ class Shooting:
         self.can_move_timer = 0
         self.normal_shooting_timer = 0
         self.normal_shooting = True
-        self.circle_shooting_timer = 1000 - self.boss.game.world_manager.level * 100
+        self.circle_shooting_timer = 1000 - level * 100
 
     def update(self):
         self.moving_timer()
@@ -121,26 +122,24 @@ class Shooting:
     def shoot(self):
         if self.time_passed(self.shoot_time, 1000):
             self.shoot_time = pygame.time.get_ticks()
-            self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/Impact5.wav'))
-            self.boss.game.bullet_manager.add_bullet(BossBullet(self.boss.game, self.boss, self.boss.room,
-                                                                self.boss.hitbox.center[0], self.boss.hitbox.center[1],
-                                                                self.boss.game.player.hitbox.center))
+            self.game.sound_manager.play('bullet_impact')
+            self.boss.game.bullet_manager.add_bullet(BossBullet, self.boss, self.boss.room,
+                                                     self.boss.hitbox.center[0], self.boss.hitbox.center[1],
+                                                     self.boss.game.player.hitbox.center)
 
     def machine_gun(self):
         if self.time_passed(self.machine_time, 100):
             self.machine_time = pygame.time.get_ticks()
-            self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/Impact5.wav'))
-            self.boss.game.bullet_manager.add_bullet(MachineGunBullet(self.boss.game, self.boss, self.boss.room,
-                                                                      self.boss.hitbox.center[0],
-                                                                      self.boss.hitbox.center[1],
-                                                                      self.boss.game.player.hitbox.center))
+            self.game.sound_manager.play('bullet_impact')
+            self.boss.game.bullet_manager.add_bullet(MachineGunBullet, self.boss, self.boss.room,
+                                                     self.boss.hitbox.center[0], self.boss.hitbox.center[1],
+                                                     self.boss.game.player.hitbox.center)
 
     def half_circle_shoot(self):
         if self.time_passed(self.circle_time, self.circle_shooting_timer):
-            self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/Impact1.wav'))
+            self.game.sound_manager.play('boss_circle_shoot')
             self.circle_time = pygame.time.get_ticks()
             for i in range(-12, 12):
-                self.boss.game.bullet_manager.add_bullet(BossBullet(self.boss.game, self.boss, self.boss.room,
-                                                                    self.boss.hitbox.center[0],
-                                                                    self.boss.hitbox.center[1],
-                                                                    self.boss.game.player.hitbox.center, 15 * i))
+                self.boss.game.bullet_manager.add_bullet(BossBullet, self.boss, self.boss.room,
+                                                         self.boss.hitbox.center[0], self.boss.hitbox.center[1],
+                                                         self.boss.game.player.hitbox.center, 15 * i)
@@ -5,16 +5,18 @@ from .entity import Entity
 from src.bullet import ImpBullet
 from src.objects.coin import Coin, Emerald, Ruby
 from src.objects.flask import RedFlask, GreenFlask
+from src.objects.treasure import Treasure
 from src.utils import time_passed
 
 
 def draw_health_bar(surf, pos, size, border_c, back_c, health_c, progress):
-    pygame.draw.rect(surf, back_c, (*pos, *size))
+    bar_rect = pygame.draw.rect(surf, back_c, (*pos, *size))
     pygame.draw.rect(surf, border_c, (*pos, *size), 1)
     inner_pos = (pos[0] + 1, pos[1] + 1)
     inner_size = ((size[0] - 2) * progress, size[1] - 2)
     rect = (round(inner_pos[0]), round(inner_pos[1]), round(inner_size[0]), round(inner_size[1]))
     pygame.draw.rect(surf, health_c, rect)
+    return bar_rect
 
 
 class Enemy(Entity):
@@ -34,26 +36,27 @@ class Enemy(Entity):
 
     def add_treasure(self):
         for _ in range(random.randint(5, 10)):
-            self.items.append(Coin(self.game, self.room))
+            self.items.append(Treasure(Coin))
         for _ in range(random.randint(1, 3)):
-            self.items.append(Emerald(self.game, self.room))
+            self.items.append(Treasure(Emerald))
         for _ in range(random.randint(0, 3)):
-            self.items.append(Ruby(self.game, self.room))
+            self.items.append(Treasure(Ruby))
         if random.randint(1, 100) == 1:  # 1 % chance
-            self.items.append(RedFlask(self.game, self.room))
+            self.items.append(Treasure(RedFlask))
         if random.randint(1, 10) == 1:  # 10 % chance
-            self.items.append(GreenFlask(self.game, self.room))
+            self.items.append(Treasure(GreenFlask))
 
     def drop_items(self):
         self.game.sound_manager.play_drop_items_sound()
-        for item in self.items:
+        for treasure in self.items:
+            item = treasure.create(self.game, self.room)
             item.rect.center = self.rect.center
             item.dropped = True
             item.activate_bounce()
             item.bounce.x = self.hitbox.center[0]
             item.bounce.y = self.hitbox.center[1]
             self.room.objects.append(item)
-            self.items.remove(item)
+            self.items.remove(treasure)
 
     def spawn(self):
         self.rect.x = random.randint(200, 1000)
@@ -142,15 +145,16 @@ class Enemy(Entity):
     def draw_health(self, surf):
         if self.hp < self.max_hp:
             health_rect = pygame.Rect(0, 0, 30, 8)
-            health_rect.midbottom = self.rect.centerx, self.rect.top
-            health_rect.midbottom = self.rect.centerx, self.rect.top
-            draw_health_bar(surf, health_rect.topleft, health_rect.size,
-                            (1, 0, 0), (255, 0, 0), (0, 255, 0), self.hp / self.max_hp)
+            rect = self.interpolated_rect()
+            health_rect.midbottom = rect.centerx, rect.top
+            return draw_health_bar(surf, health_rect.topleft, health_rect.size,
+                                   (1, 0, 0), (255, 0, 0), (0, 255, 0), self.hp / self.max_hp)
 
     def draw(self):
-        self.draw_shadow(self.room.tile_map.map_surface)
-        self.room.tile_map.map_surface.blit(self.image, self.rect)
-        self.draw_health(self.room.tile_map.map_surface)
+        tile_map = self.room.tile_map
+        tile_map.add_dirty_rect(self.draw_shadow(tile_map.map_surface))
+        tile_map.add_dirty_rect(tile_map.map_surface.blit(self.image, self.interpolated_rect()))
+        tile_map.add_dirty_rect(self.draw_health(tile_map.map_surface))
 
 
 class Demon(Enemy):
@@ -175,10 +179,9 @@ class Imp(Enemy):
     def shoot(self):
         if not sum(self.velocity) and time_passed(self.time, 750) and self.game.player.dead is False and not self.dead:
             self.time = pygame.time.get_ticks()
-            self.game.bullet_manager.add_bullet(
-                ImpBullet(self.game, self, self.room, self.hitbox.midbottom[0], self.hitbox.midbottom[1],
-                          self.game.player.hitbox.midbottom))
-            self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/Shoot5.wav'))
+            self.game.bullet_manager.add_bullet(ImpBullet, self, self.room, self.hitbox.midbottom[0],
+                                                self.hitbox.midbottom[1], self.game.player.hitbox.midbottom)
+            self.game.sound_manager.play('imp_shoot')
 
     def update(self):
         self.move()
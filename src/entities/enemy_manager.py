@@ -1,15 +1,15 @@
 import pygame
 import random
-from src.map.map_generator import Room
-from src.map.map_generator import Room
 from src.entities.enemy import Imp, Enemy, Demon
 from src.entities.boss import Boss
+from src.spatial_hash import SpatialHash
 
 
 class EnemyManager:
     def __init__(self, game):
         self.game = game
         self.enemy_list = []
+        self.spatial_hash = SpatialHash()  # enemies of current room, rebuilt every frame
         self.damage_multiplier = 1
         self.health_multiplier = 1
 
@@ -30,16 +30,43 @@ class EnemyManager:
         for enemy in self.game.world_manager.current_room.enemy_list:
             enemy.update()
         self.debug()
+        self.update_spatial_hash()
+
+    def update_spatial_hash(self):
+        self.spatial_hash.clear()
+        for enemy in self.enemy_list:
+            self.spatial_hash.insert(enemy, enemy.rect.union(enemy.hitbox))
+
+    def nearby_enemies(self, rect):
+        """Returns enemies of current room that might collide with rect"""
+        return self.spatial_hash.query(rect)
 
     def add_enemies(self):
-        for row in self.game.world_manager.world.world:
-            for room in row:
-                if isinstance(room, Room) and room.type == 'normal':
-                    self.add_normal_enemies(room)
-                if isinstance(room, Room) and room.type == 'boss':
-                    room.enemy_list.append(Boss(self.game, room))
-                    self.upgrade_enemy(room.enemy_list[-1])
-                    room.enemy_list[-1].bullet_damage *= self.damage_multiplier
+        world = self.game.world_manager.world
+        for _ in self.spawn_enemies(world, self.game.world_manager.level):
+            pass
+        self.upgrade_enemies(world)
+
+    def spawn_enemies(self, world, level):
+        """Creates enemies of level's strength room by room, yields after every room so that it can be spread over
+        frames. Damage and health multipliers are applied later by upgrade_enemies"""
+        for room in world.get_rooms():
+            if room.type == 'normal':
+                self.add_normal_enemies(room, level)
+                yield
+            if room.type == 'boss':
+                room.enemy_list.append(Boss(self.game, room, level))
+                yield
+
+    def upgrade_enemies(self, world):
+        for room in world.get_rooms():
+            if room.type == 'normal':
+                for enemy in room.enemy_list:
+                    self.upgrade_enemy(enemy)
+            if room.type == 'boss':
+                for enemy in room.enemy_list:
+                    self.upgrade_enemy(enemy)
+                    enemy.bullet_damage *= self.damage_multiplier
 
     def set_enemy_damage(self, enemy):
         enemy.damage *= self.damage_multiplier
@@ -52,17 +79,14 @@ class EnemyManager:
         self.set_enemy_health(enemy)
         self.set_enemy_damage(enemy)
 
-    def add_normal_enemies(self, room):
-        level = self.game.world_manager.level
+    def add_normal_enemies(self, room, level):
         num_of_demons = random.randint(1 + level, 4 + level)
         num_of_imps = random.randint(0 + level, 4 + level)
         for _ in range(num_of_imps):
             room.enemy_list.append(Imp(self.game, random.randint(100, 150) / 10, 100, room))
-            self.upgrade_enemy(room.enemy_list[-1])
             room.enemy_list[-1].spawn()
         for _ in range(num_of_demons):
             room.enemy_list.append(Demon(self.game, 100, room))
-            self.upgrade_enemy(room.enemy_list[-1])
             room.enemy_list[-1].spawn()
 
     def debug(self):
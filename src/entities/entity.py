@@ -1,7 +1,6 @@
-import pygame
 import src.utils as utils
 from .animation import load_animation_sprites, EntityAnimation
-from src.utils import get_mask_rect
+from src.utils import get_cached_mask_rect, get_cached_mask
 from src.particles import DeathAnimation
 
 
@@ -11,10 +10,10 @@ class Entity:
         self.name = name
         self.path = f'./assets/characters/{self.name}'
         self.animation_database = load_animation_sprites(f'{self.path}/')
-        self.image = pygame.transform.scale(pygame.image.load(f'{self.path}/idle/idle0.png'),
-                                            utils.basic_entity_size).convert_alpha()
+        self.image = self.animation_database['left']['IDLE'][0]
         self.rect = self.image.get_rect()
-        self.hitbox = get_mask_rect(self.image, *self.rect.topleft)
+        self.previous_position = self.rect.topleft  # position at the start of the last simulation step
+        self.hitbox = get_cached_mask_rect(self.image, *self.rect.topleft)
         self.velocity = [0, 0]
         self.hurt = False
         self.dead = False
@@ -30,6 +29,11 @@ class Entity:
     def __str__(self):
         return f'{id(self)}, {self.name}'
 
+    @property
+    def mask(self):
+        """Mask of current animation frame, used by pygame.sprite.collide_mask"""
+        return get_cached_mask(self.image)
+
     def set_velocity(self, new_velocity):
         self.velocity = new_velocity
 
@@ -50,6 +54,7 @@ class Entity:
                 self.room.enemy_list.remove(self)
 
     def basic_update(self):
+        self.previous_position = self.rect.topleft
         self.detect_death()
         self.update_hitbox()
         self.entity_animation.update()
@@ -59,21 +64,27 @@ class Entity:
     def wall_collision(self):
         test_rect = self.hitbox.move(*self.velocity)  # Position after moving, change name later
         collide_points = (test_rect.midbottom, test_rect.bottomleft, test_rect.bottomright)
-        for wall in self.game.world_manager.current_map.wall_list:
-            if any(wall.hitbox.collidepoint(point) for point in collide_points):
-                self.velocity = [0, 0]
+        if self.game.world_manager.current_map.wall_collision(collide_points):
+            self.velocity = [0, 0]
+
+    def interpolation_offset(self):
+        """Offset from the simulated position to the drawn one, frames are drawn between the last two steps"""
+        dx, dy = self.previous_position[0] - self.rect.x, self.previous_position[1] - self.rect.y
+        if abs(dx) > 64 or abs(dy) > 64:  # teleported, e.g. moved to another room
+            return 0, 0
+        return round(dx * (1 - self.game.alpha)), round(dy * (1 - self.game.alpha))
+
+    def interpolated_rect(self):
+        return self.rect.move(self.interpolation_offset())
 
     def update_hitbox(self):
-        self.hitbox = get_mask_rect(self.image, *self.rect.topleft)
+        self.hitbox = get_cached_mask_rect(self.image, *self.rect.topleft)
         self.hitbox.midbottom = self.rect.midbottom
 
     def moving(self):
         return self.velocity[0] != 0 or self.velocity[1] != 0
 
     def draw_shadow(self, surface, dimension=50, size=(0, 0, 15, 7), vertical_shift=-5, horizontal_shift=-1):
-        color = (0, 0, 0, 120)
-        shape_surf = pygame.Surface((dimension, dimension), pygame.SRCALPHA).convert_alpha()
-        pygame.draw.ellipse(shape_surf, color, size)
-        shape_surf = pygame.transform.scale(shape_surf, (2 * dimension, 2 * dimension))
-        position = [self.hitbox.bottomleft[0] + horizontal_shift, self.hitbox.bottomleft[1] + vertical_shift]
-        surface.blit(shape_surf, position)
+        dx, dy = self.interpolation_offset()
+        position = [self.hitbox.bottomleft[0] + horizontal_shift + dx, self.hitbox.bottomleft[1] + vertical_shift + dy]
+        return utils.draw_shadow(surface, position, size, dimension)
@@ -1,12 +1,9 @@
-import pygame
 import random
 from src.utils import get_mask_rect
 from src.objects.object import ShowName
-from src.objects.weapon import AnimeSword, FireSword, Staff
-from src.objects.power_up import ShieldPowerUp, AttackPowerUp
-from src.objects.flask import GreenFlask, RedFlask
-import numpy
+from src.objects.treasure import choose_rare_items
 from src.entities.entity import Entity
+from src.entities.animation import load_animation_sprites
 
 class Merchant(Entity):
     name = 'merchant'
@@ -31,25 +28,17 @@ class Merchant(Entity):
         self.interaction = False
         for item in self.items:
             self.room.objects.append(item)
-        self.room.tile_map.wall_list.append(self)
+        self.room.tile_map.add_wall(self)
         self.dead = False
         self.player_bought = False
 
     def load_images(self):
-        for i in range(4):
-            image = pygame.image.load(f'./assets/characters/{self.name}/idle/idle{i}.png').convert_alpha()
-            image = pygame.transform.scale(image, self.size)
-            self.images.append(image)
+        self.images = load_animation_sprites(f'./assets/characters/{self.name}/', self.size)['left']['IDLE']
         self.image = self.images[0]
 
     def add_items(self):
-        items = [AnimeSword(self.game, self.room), RedFlask(self.game, self.room),
-                 ShieldPowerUp(self.game, self.room), AttackPowerUp(self.game, self.room),
-                 GreenFlask(self.game, self.room), FireSword(self.game, self.room),
-                 Staff(self.game, self.room)]
-        items = numpy.random.choice(items, size=2, replace=False, p=[0.03, 0.01, 0.2, 0.2, 0.5, 0.03, 0.03])
-        for it in items:
-            self.items.append(it)
+        for kind in choose_rare_items(2):
+            self.items.append(kind(self.game, self.room))
         self.items[-1].rect.center = self.items_position[1]
         self.items[-2].rect.center = self.items_position[0]
         self.items[-1].for_sale = True
@@ -69,7 +58,7 @@ class Merchant(Entity):
         self.update_animation_frame()
         self.detect_collision()
         if self.interaction:
-            self.dialog.draw(self.room.tile_map.map_surface, self.rect)
+            self.room.tile_map.add_dirty_rect(self.dialog.draw(self.room.tile_map.map_surface, self.rect))
         else:
             self.dialog.text = random.choice(self.texts)
             self.dialog.text_length = len(self.dialog.text)
@@ -80,6 +69,7 @@ class Merchant(Entity):
 
 
     def draw(self):
+        tile_map = self.room.tile_map
         # self.draw_shadow(self.room.tile_map.map_surface)
-        self.draw_shadow(self.room.tile_map.map_surface, 100, (0,0,40, 14), -15 + self.animation_frame,3)
-        self.room.tile_map.map_surface.blit(self.image, self.rect)
+        tile_map.add_dirty_rect(self.draw_shadow(tile_map.map_surface, 100, (0,0,40, 14), -15 + self.animation_frame,3))
+        tile_map.add_dirty_rect(tile_map.map_surface.blit(self.image, self.rect))
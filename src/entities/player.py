@@ -6,17 +6,39 @@ from .entity import Entity
 from src.particles import Dust
 
 
+def stat(name):
+    """Player attribute that calls stats listeners (like HUD) whenever its value changes"""
+    attribute = f'_{name}'
+
+    def get_value(self):
+        return getattr(self, attribute)
+
+    def set_value(self, value):
+        if getattr(self, attribute) != value:
+            setattr(self, attribute, value)
+            for listener in self.stats_listeners:
+                listener()
+
+    return property(get_value, set_value)
+
+
 class Player(Entity):
     name = 'player'
     speed = 360
-    max_hp = 100
-    gold = 0
-    shield = 1
-    strength = 1
-    hp = max_hp
+    _max_hp = 100
+    _gold = 0
+    _shield = 1
+    _strength = 1
+    _hp = _max_hp
+    max_hp = stat('max_hp')
+    gold = stat('gold')
+    shield = stat('shield')
+    strength = stat('strength')
+    hp = stat('hp')
     items = []
 
     def __init__(self, game):
+        self.stats_listeners = []
         Entity.__init__(self, game, self.name)
         self.rect = self.image.get_rect(center=(512 + 2.5 * 64, 600))
         self.weapon = None
@@ -104,7 +126,7 @@ class Player(Entity):
             self.rect.y += value
         else:
             self.falling = False
-            self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/Hit.wav'))
+            self.game.sound_manager.play('bounce')
 
     def add_walking_particles(self):
         if self.moving():
@@ -112,6 +134,7 @@ class Player(Entity):
             self.game.particle_manager.add_particle(Dust(self.game, self, *self.rect.midbottom))
 
     def update(self) -> None:
+        self.previous_position = self.rect.topleft
         if self.falling:
             self.falling_update()
         else:
@@ -135,18 +158,18 @@ class Player(Entity):
     def calculate_collision(self, enemy):
         if not self.shield and not self.dead:
             self.hp -= enemy.damage
-            self.game.sound_manager.play(self.game.sound_manager.player_hurt)
+            self.game.sound_manager.play('player_hurt')
             if not self.dead:
                 self.hurt = True
             self.entity_animation.hurt_timer = pygame.time.get_ticks()
         if self.shield:
             self.shield -= 1
-            self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/Random1.wav'))
+            self.game.sound_manager.play('fall')
 
     def draw(self, surface):
         if self.death_counter == 0:
             return
-        self.draw_shadow(surface)
-        surface.blit(self.image, self.rect)
+        self.game.add_dirty_rect(self.draw_shadow(surface))
+        self.game.add_dirty_rect(surface.blit(self.image, self.interpolated_rect()))
         if self.weapon:
             self.weapon.draw()
@@ -10,7 +10,6 @@ from .background import BackgroundEffects
 from .map.world_manager import WorldManager
 from .objects.object_manager import ObjectManager
 from .game_over import GameOver
-import time
 from .bullet import BulletManager
 from .sound_manager import SoundManager
 pygame.init()
@@ -21,6 +20,10 @@ world_size = (21 * 64, 14 * 64)
 
 
 class Game:
+    dirty_rendering = True  # update only changed parts of the display instead of flipping whole of it
+    tick_rate = 60  # simulation steps per second, independent of the frame rate
+    max_ticks = 5  # simulation steps per frame at most, under heavy load the game slows down instead of freezing
+
     def __init__(self):
         self.display = pygame.display.set_mode(world_size)
         self.screen = pygame.Surface(world_size).convert()
@@ -41,17 +44,21 @@ class Game:
         self.background = BackgroundEffects()
         self.game_over = GameOver(self)
         pygame.mixer.init()
-        self.dt = 0
-        self.sound = pygame.mixer.Sound('./assets/sound/dungeon_theme_1.wav')
+        self.dt = 1 / self.tick_rate
+        self.accumulator = 0  # time not simulated yet
+        self.alpha = 0  # how far between the last two simulation steps the frame is drawn
         self.screen_position = (0, 0)
+        self.dirty_rects = []  # parts of the screen drawn on this frame
+        self.previous_dirty_rects = []
+        self.full_refresh = True
 
     def refresh(self):
-        pygame.mixer.Sound.stop(self.sound)
         self.__init__()
         pygame.display.flip()
         self.run_game()
 
     def update_groups(self):
+        self.sound_manager.update()
         self.enemy_manager.update_enemies()
         self.object_manager.update()
         self.player.update()
@@ -63,9 +70,41 @@ class Game:
         self.game_over.update()
         self.mini_map.update()
 
-    def draw_groups(self):
+    def simulate(self, frame_time):
+        """Runs as many fixed steps as frame_time covers, the rest carries over to the next frame"""
+        self.accumulator += frame_time
+        ticks = 0
+        while self.accumulator >= self.dt and ticks < self.max_ticks:
+            self.update_groups()
+            self.accumulator -= self.dt
+            ticks += 1
+        if ticks == self.max_ticks:
+            self.accumulator %= self.dt
+        self.alpha = self.accumulator / self.dt
+
+    def draw_background(self):
+        """Draws background effects and the maps over the whole screen"""
+        self.screen.fill((0, 0, 0))
+        self.background.render()
         self.background.draw(self.screen)
         self.world_manager.draw_map(self.screen)
+
+    def restore_background(self):
+        """Redraws background effects and the maps only where the screen was drawn on in the previous frame or
+        where they change in this one, the rest of the screen is kept from the previous frame"""
+        changed = self.background.render() + self.world_manager.current_map.get_screen_rects()
+        self.dirty_rects.extend(changed)
+        rects = changed + self.previous_dirty_rects
+        for rect in rects:
+            self.screen.fill((0, 0, 0), rect)
+        self.background.draw(self.screen, rects)
+        self.world_manager.draw_map(self.screen, rects)
+
+    def draw_groups(self):
+        if self.needs_full_refresh():
+            self.draw_background()
+        else:
+            self.restore_background()
         if self.player:
             self.player.draw(self.screen)
         self.enemy_manager.draw_enemies(self.screen)
@@ -73,10 +112,41 @@ class Game:
         self.bullet_manager.draw()
         self.mini_map.draw(self.screen)
         self.hud.draw()
-        self.particle_manager.draw_particles(self.world_manager.current_map.map_surface)
+        self.particle_manager.draw_particles(self.world_manager.current_map)
         self.particle_manager.draw_fire_particles()
         self.game_over.draw()
 
+    def add_dirty_rect(self, rect):
+        """Remember part of the screen that was drawn on this frame"""
+        if rect:
+            self.dirty_rects.append(rect)
+
+    def needs_full_refresh(self):
+        return (
+                self.full_refresh
+                or not self.dirty_rendering
+                or self.world_manager.switch_room
+                or self.world_manager.new_level
+                or self.world_manager.move_current_room
+                or self.player.dead
+                or self.screen_position != (0, 0)
+        )
+
+    def update_display(self):
+        """Flip whole display when the view moves, otherwise copy and update only parts drawn on this or previous
+        frame"""
+        if self.needs_full_refresh():
+            self.display.blit(self.screen, self.screen_position)
+            pygame.display.flip()
+            self.full_refresh = False
+            self.dirty_rects = [self.screen.get_rect()]
+        else:
+            rects = self.dirty_rects + self.previous_dirty_rects
+            self.display.blits([(self.screen, rect, rect) for rect in rects], doreturn=False)
+            pygame.display.update(rects)
+        self.previous_dirty_rects = self.dirty_rects
+        self.dirty_rects = []
+
     def input(self):
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -98,20 +168,16 @@ class Game:
 
     def run_game(self):
         self.enemy_manager.add_enemies()
-        prev_time = time.time()
-        pygame.mixer.Sound.play(self.sound, loops=-1)
+        self.sound_manager.play_level_music(self.world_manager.level)
         while self.running:
-            self.clock.tick(self.fps)
-            now = time.time()
-            self.dt = now - prev_time
-            prev_time = now
-            self.menu.show()
-            self.screen.fill((0, 0, 0))
+            frame_time = self.clock.tick(self.fps) / 1000
+            if self.menu.running:
+                self.menu.show()
+                self.full_refresh = True
             self.input()
-            self.update_groups()
+            self.simulate(frame_time)
             self.draw_groups()
             self.game_time = pygame.time.get_ticks()
-            self.display.blit(self.screen, self.screen_position)
             if self.running:
-                pygame.display.flip()
+                self.update_display()
         pygame.quit()
@@ -15,7 +15,6 @@ class GameOver:
         self.position = [utils.world_size[0] / 2 - 180, - 800]
         self.hover_value = -5
         self.game_over = False
-        self.sound = pygame.mixer.Sound('./assets/sound/GameOver2.wav')
         self.played = False
 
     @staticmethod
@@ -26,7 +25,7 @@ class GameOver:
 
     def play_sound(self):
         if not self.played:
-            pygame.mixer.Sound.play(self.sound)
+            self.game.sound_manager.play('game_over')
             self.played = True
 
     def update(self):
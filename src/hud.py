@@ -21,26 +21,26 @@ class HealthBar:
         self.end = pygame.image.load(f'{self.path}/end.png').convert_alpha()
         self.start = pygame.image.load(f'{self.path}/start.png').convert_alpha()
 
-    def draw_health_rectangle(self):
+    def draw_health_rectangle(self, surface):
         current_hp = self.player.hp
         max_hp = self.player.max_hp
-        pygame.draw.rect(self.game.screen, self.max_hp_color, (25, 10, max_hp + max_hp / 2, 20))
+        bar_rect = pygame.draw.rect(surface, self.max_hp_color, (25, 10, max_hp + max_hp / 2, 20))
         num_of_blocks = int(current_hp // 10)
         end_position = None
         for i in range(num_of_blocks):
-            pygame.draw.rect(self.game.screen, self.hp_color, (25 + i * 15, 15, 10, 15))
+            pygame.draw.rect(surface, self.hp_color, (25 + i * 15, 15, 10, 15))
             end_position = (25 + i * 15 + 15)
         if end_position:
-            pygame.draw.rect(self.game.screen, self.hp_color, (end_position, 15, current_hp % 10, 15))
-        self.draw()
+            pygame.draw.rect(surface, self.hp_color, (end_position, 15, current_hp % 10, 15))
+        return bar_rect.union(self.draw(surface))
 
-    def draw(self):
+    def draw(self, surface):
         end_position = None
-        self.game.screen.blit(self.start, (0, 0))
+        frame_rect = surface.blit(self.start, (0, 0))
         for i in range(self.player.max_hp // 10):
-            self.game.screen.blit(self.block, (i * 15 + 40, 0))
+            surface.blit(self.block, (i * 15 + 40, 0))
             end_position = (i * 15 + 40, 0)
-        self.game.screen.blit(self.end, end_position)
+        return frame_rect.union(surface.blit(self.end, end_position))
 
 
 class PlayerGold:
@@ -63,9 +63,9 @@ class PlayerGold:
 
     def draw(self, surface):
         self.update()
-        surface.blit(self.image, (0, 50))
-        text_surface = pygame.font.Font(utils.font, 24).render(self.text, True, (255, 255, 255))
-        surface.blit(text_surface, (25, 55))
+        image_rect = surface.blit(self.image, (0, 50))
+        text_surface = utils.render_text(self.text, 24)
+        return image_rect.union(surface.blit(text_surface, (25, 55)))
 
 
 class PlayerShield:
@@ -91,9 +91,9 @@ class PlayerShield:
 
     def draw(self, surface):
         self.update()
-        surface.blit(self.image, self.image_position)
-        text_surface = pygame.font.Font(utils.font, 24).render(self.text, True, (255, 255, 255))
-        surface.blit(text_surface, self.text_position)
+        image_rect = surface.blit(self.image, self.image_position)
+        text_surface = utils.render_text(self.text, 24)
+        return image_rect.union(surface.blit(text_surface, self.text_position))
 
 
 class PlayerAttack(PlayerShield):
@@ -123,6 +123,11 @@ class Hud:
         self.shield = PlayerShield(self.game.player)
         self.attack = PlayerAttack(self.game.player)
         self.health_bar = HealthBar(self.game.player, self.game)
+        self.layer_surface = pygame.Surface(utils.world_size, pygame.SRCALPHA).convert_alpha()
+        self.layer = None  # layer_surface with stats drawn on, None when it has to be rebuilt
+        self.layer_rects = []  # parts of layer_surface that were drawn on
+        self.level = None
+        self.player.stats_listeners.append(self.invalidate)
 
     def draw_items(self):
         # works for 3 items
@@ -134,13 +139,26 @@ class Hud:
                     position = self.items_positions[(i // 2) * -1]
                 self.game.screen.blit(item.hud_image, position)
 
+    def invalidate(self):
+        self.layer = None
+
+    def build_layer(self):
+        """Draws health bar, gold, shield, attack and level onto the cached HUD layer"""
+        self.level = self.game.world_manager.level
+        self.layer_surface.fill((0, 0, 0, 0))
+        text_surface = utils.render_text(f'LEVEL: {int(self.level)}', 15)
+        rects = [self.layer_surface.blit(text_surface, (600, 0)),
+                 self.health_bar.draw_health_rectangle(self.layer_surface),
+                 self.gold.draw(self.layer_surface),
+                 self.shield.draw(self.layer_surface),
+                 self.attack.draw(self.layer_surface)]
+        self.layer_rects = [rect.clip(self.layer_surface.get_rect()) for rect in rects]
+        self.layer = self.layer_surface
+
     def draw_info(self):
         text2 = f'FPS: {int(self.game.clock.get_fps())}'
-        text_surface = pygame.font.Font(utils.font, 15).render(text2, True, (255, 255, 255))
-        self.game.screen.blit(text_surface, (0, 150))
-        text2 = f'LEVEL: {int(self.game.world_manager.level)}'
-        text_surface = pygame.font.Font(utils.font, 15).render(text2, True, (255, 255, 255))
-        self.game.screen.blit(text_surface, (600, 0))
+        text_surface = utils.render_text(text2, 15)
+        self.game.add_dirty_rect(self.game.screen.blit(text_surface, (0, 150)))
         # text3 = f'C1111pa: {str(int(self.player.rect.x)), str(int(self.game.player.rect.midbottom[1]))}'
         # text_surface = pygame.font.Font(utils.font, 15).render(text3, True, (255, 255, 255))
         # self.game.screen.blit(text_surface, (0, 140))
@@ -148,10 +166,11 @@ class Hud:
         # text_surface = pygame.font.Font(utils.font, 15).render(text4, True, (255, 255, 255))
         # self.game.screen.blit(text_surface, (0, 200))
         # # self.hp.draw(self.game.screen)
-        self.health_bar.draw_health_rectangle()
-        self.gold.draw(self.game.screen)
-        self.shield.draw(self.game.screen)
-        self.attack.draw(self.game.screen)
+        if self.layer is None or self.level != self.game.world_manager.level:
+            self.build_layer()
+        # drawn every frame, so that the screen is restored under the layer before it is blitted again
+        for rect in self.layer_rects:
+            self.game.add_dirty_rect(self.game.screen.blit(self.layer, rect, rect))
 
     def draw(self):
         # self.game.screen.blit(self.hud_frame, self.rect)
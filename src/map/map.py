@@ -1,3 +1,4 @@
+import numpy
 import pygame
 from collections import namedtuple
 import math
@@ -6,7 +7,7 @@ import src.utils as utils
 
 class Spritesheet(object):
     def __init__(self, filename):
-        self.sheet = pygame.image.load(filename).convert_alpha()
+        self.sheet = utils.load_image(filename)
 
     def image_at(self, rectangle, colorkey=None):
         rect = pygame.Rect(rectangle)
@@ -21,41 +22,71 @@ class Spritesheet(object):
         return image
 
 
-class Tile(pygame.sprite.Sprite):
-    def __init__(self, rectangle, x, y, spritesheet, size):
-        pygame.sprite.Sprite.__init__(self)
-        self.size = size
-        self.image = spritesheet.image_at(rectangle)
-        self.image = pygame.transform.scale(self.image, self.size)
-        self.rect = self.image.get_rect()
-        self.rect.x, self.rect.y = x, y
-        self.hitbox = utils.get_mask_rect(self.image, *self.rect.topleft)
+class TileAtlas:
+    """Spritesheet cut into tiles, every tile id is cut out and scaled only once and shared by all rooms"""
 
-    def draw(self, surface):
-        surface.blit(self.image, (self.rect.x, self.rect.y))
+    def __init__(self, filename, tile_size=64):
+        self.spritesheet = Spritesheet(filename)
+        self.tile_size = tile_size
+        self.images = {}  # tile id: scaled image
+
+    @staticmethod
+    def get_location(number):
+        a = number // 32
+        b = number % 32
+        return b * 16, a * 16
 
-    def change_image(self, rectangle, spritesheet):
-        self.image = spritesheet.image_at(rectangle)
-        self.image = pygame.transform.scale(self.image, self.size)
+    def get_image(self, tile_id):
+        if tile_id not in self.images:
+            image = self.spritesheet.image_at((*self.get_location(tile_id), 16, 16))
+            self.images[tile_id] = pygame.transform.scale(image, (self.tile_size, self.tile_size))
+        return self.images[tile_id]
+
+
+tile_atlases = {}  # (filename, tile_size): TileAtlas
+
+
+def get_tile_atlas(filename='./assets/misc/spritesheet.png', tile_size=64):
+    if (filename, tile_size) not in tile_atlases:
+        tile_atlases[(filename, tile_size)] = TileAtlas(filename, tile_size)
+    return tile_atlases[(filename, tile_size)]
+
+
+class Tile:
+    """Cell of a tile layer, its image is shared with all tiles of the same id"""
+
+    def __init__(self, tile_id, x, y, atlas):
+        self.tile_id = tile_id
+        self.image = atlas.get_image(tile_id)
+        self.rect = self.image.get_rect(topleft=(x, y))
+        self.hitbox = utils.get_cached_mask_rect(self.image, *self.rect.topleft)
+
+    def draw(self, surface):
+        surface.blit(self.image, self.rect)
 
 
 class TileMap:
-    def __init__(self, room, filename, spritesheet, tile_size=64):
+    max_dirty_rects = 500  # above that, whole map is restored at once
+
+    def __init__(self, room, filename, atlas, tile_size=64):
         self.room = room
         # self.map_width = len(filename[0][0])
         # self.map_height = len(filename[0]) + 1
         # self.map_size = (len(filename[0][0]) * 64 + 128, (len(filename[0]) + 1) * 64)
         self.map_size = (utils.world_size[0], utils.world_size[1])
         self.tile_size = tile_size
-        self.spritesheet = spritesheet
+        self.atlas = atlas
         self.wall_list = []
+        self.wall_grid = {}  # (column, row) of tile_size cell -> walls whose hitbox overlaps that cell
         self.door = namedtuple('Door', ['direction', 'value', 'tile'])
-        self.tiles = []
+        self.layers = []  # grid of tile ids for every layer, -1 is an empty cell
+        self.tiles = []  # (tile id, position) of non-empty cells for every layer
         self.filename = filename
         self.load_tiles(filename)
         self.original_map_surface = pygame.Surface(self.map_size).convert()
-        self.original_map_surface.set_colorkey((0, 0, 0, 0))
         self.map_surface = None
+        self.dirty_rects = []  # parts of map_surface drawn on since last draw_map
+        self.full_redraw = False
         self.x, self.y = 0, 0  # position of map surface on screen surface
         self.game = None
         self.load_map()
@@ -66,40 +97,83 @@ class TileMap:
         if self.x != 0:
             self.x = 0
 
-    def draw_map(self, surface):
-        surface.blit(self.map_surface, (self.x, self.y))
+    def draw_map(self, surface, rects=None):
+        """Blits map_surface onto surface, only inside rects (in surface coordinates) if given"""
+        if rects is None:
+            surface.blit(self.map_surface, (self.x, self.y))
+        else:
+            surface.blits([(self.map_surface, rect, rect.move(-self.x, -self.y)) for rect in rects], doreturn=False)
         self.clear_map()
         # for wall in self.wall_list:
         #     pygame.draw.rect(surface, (255, 255, 255), wall.rect, 2)
 
+    def add_dirty_rect(self, rect):
+        """Remember part of map_surface that was drawn on, so that it gets restored after being shown"""
+        if self.full_redraw or not rect:
+            return
+        self.dirty_rects.append(rect)
+        if len(self.dirty_rects) > self.max_dirty_rects:
+            self.redraw()
+
+    def redraw(self):
+        """Restore whole map_surface next time it is cleared"""
+        self.full_redraw = True
+        self.dirty_rects = [self.map_surface.get_rect()]
+
+    def get_screen_rects(self):
+        """Returns parts of the screen that the next draw_map changes, because of what was drawn on the map"""
+        return [rect.move(self.x, self.y) for rect in self.dirty_rects]
+
     def clear_map(self):
-        self.map_surface = self.original_map_surface.copy()
+        """Restore drawn on parts of map_surface from original_map_surface"""
+        if self.full_redraw:
+            self.map_surface.blit(self.original_map_surface, (0, 0))
+            self.full_redraw = False
+        else:
+            for rect in self.dirty_rects:
+                self.map_surface.blit(self.original_map_surface, rect, rect)
+        self.dirty_rects = []
 
     def load_map(self):
         self.original_map_surface.fill(utils.BLACK)
         for layer in self.tiles:
-            for tile in layer:
-                tile.draw(self.original_map_surface)
-        self.clear_map()
-
-    @staticmethod
-    def get_location(number):
-        a = number // 32
-        b = number % 32
-        return b * 16, a * 16
-
+            self.original_map_surface.blits([(self.atlas.get_image(tile_id), position) for tile_id, position in layer],
+                                            doreturn=False)
+        self.map_surface = self.original_map_surface.copy()
+        self.map_surface.set_colorkey(utils.BLACK)
+
+    def get_cells(self, rect):
+        """Returns grid cells overlapped by rect"""
+        first_column, first_row = rect.left // self.tile_size, rect.top // self.tile_size
+        last_column, last_row = (rect.right - 1) // self.tile_size, (rect.bottom - 1) // self.tile_size
+        return [(column, row) for column in range(first_column, last_column + 1)
+                for row in range(first_row, last_row + 1)]
+
+    def add_wall(self, wall):
+        """Adds tile or any other object with a hitbox that blocks movement"""
+        self.wall_list.append(wall)
+        if wall.hitbox:
+            for cell in self.get_cells(wall.hitbox):
+                self.wall_grid.setdefault(cell, []).append(wall)
+
+    def wall_collision(self, points):
+        """Returns True if any of the points lies inside hitbox of a wall"""
+        for point in points:
+            cell = (int(point[0] // self.tile_size), int(point[1] // self.tile_size))
+            for wall in self.wall_grid.get(cell, ()):
+                if wall.hitbox.collidepoint(point):
+                    return True
+        return False
 
     def load_tiles(self, filename):
         for file in filename:
-            tiles = []
-            x, y = 0, self.tile_size / 2
-            for row in file:
-                x = self.tile_size
-                for tile in row:
-                    tiles.append(Tile((*self.get_location(int(tile)), 16, 16), x, y, self.spritesheet,
-                                      (self.tile_size, self.tile_size)))
-                    if int(tile) in utils.wall_list:
-                        self.wall_list.append(tiles[-1])
-                    x += self.tile_size
-                y += self.tile_size
-            self.tiles.append(tiles)
+            layer = numpy.asarray(file, dtype=numpy.int16)
+            self.layers.append(layer)
+            rows, columns = numpy.nonzero(layer != -1)
+            tile_ids = layer[rows, columns].tolist()
+            xs = ((columns + 1) * self.tile_size).tolist()
+            ys = (rows * self.tile_size + self.tile_size // 2).tolist()
+            self.tiles.append([(tile_id, (x, y)) for tile_id, x, y in zip(tile_ids, xs, ys)])
+            for tile_id, x, y in zip(tile_ids, xs, ys):
+                if tile_id in utils.wall_list:
+                    self.add_wall(Tile(tile_id, x, y, self.atlas))
@@ -1,10 +1,9 @@
-import copy
 import csv
 import random
-
+import numpy
 
 from src.objects.chest import Chest
-from .map import TileMap, Spritesheet
+from .map import TileMap, get_tile_atlas
 from src.objects.weapon import Weapon, AnimeSword, FireSword, Staff
 from src.objects.flask import RedFlask, GreenFlask
 from src.particles import Fire
@@ -14,6 +13,17 @@ from src.entities.merchant import Merchant
 import src.utils as utils
 
 
+room_templates = {}  # file name: grid of tile ids parsed from maps/<file>.csv
+
+
+def load_room_template(file):
+    """Parses a room template only once, rooms get copies of the returned grid"""
+    if file not in room_templates:
+        with open(f'./maps/{file}.csv', newline='') as f:
+            room_templates[file] = numpy.array(list(csv.reader(f)), dtype=numpy.int16)
+    return room_templates[file]
+
+
 class Room:
     def __init__(self, x, y):
         self.x = x  # position in game world
@@ -22,7 +32,7 @@ class Room:
         self.neighbours = []  # neighbouring rooms coordinates
         self.doors = []  # door locations
         self.type = None  # type of the room
-        self.room_map = []  # csv file of Tile identifiers
+        self.room_map = []  # grids of tile ids, one for each layer
         self.tile_map = None  # TileMap
         self.discovered = False  # player been in this room
         self.enemy_list = []  # list of enemies at that room
@@ -57,8 +67,11 @@ class Room:
 
 
 class World:
-    def __init__(self, wm, game, num_of_rooms, width, height):
-        self.level = wm.level
+    floor_weights = numpy.array([10, 1, 1, 1, 1, 0.2, 0.2, 0.2])  # how often each of utils.floor_tiles is used
+
+    def __init__(self, wm, game, num_of_rooms, width, height, seed=None, level=None, staged=False):
+        self.level = wm.level if level is None else level
+        self.random = numpy.random.default_rng(seed)  # floor layouts are reproducible for the same seed
         self.game = game
         self.num_of_rooms = num_of_rooms
         self.width = width
@@ -66,19 +79,31 @@ class World:
         self.world = [[None for _ in range(width)] for _ in range(height)]  # populate world with
         self.x, self.y = random.randint(0, height - 1), random.randint(0, width - 1)  # current world coordinates
         self.starting_room = None
-        self.create_world()
+        if not staged:  # staged worlds are created by iterating build()
+            self.create_world()
 
     def create_world(self):
+        for _ in self.build():
+            pass
+
+    def build(self):
+        """Creates the world step by step, yields after every step so that creation can be spread over frames"""
         self.generate_rooms()
         self.assign_type()
         # self.add_neighbors()
-        self.add_room_map('mapa4')
-        self.add_room_map('mapa3')
-        self.add_room_map('floor_layer')
-        self.add_room_map('wall_layer')
-        self.add_graphics()
+        yield
+        for file in ('mapa4', 'mapa3', 'floor_layer', 'wall_layer'):
+            self.add_room_map(file)
+            yield
+        for room in self.get_rooms():
+            self.add_graphics(room)
+            yield
         # self.print_world()
         self.assign_objects()
+        yield
+
+    def get_rooms(self):
+        return [room for row in self.world for room in row if isinstance(room, Room)]
 
     @staticmethod
     def check_boundary(coordinate, world_param):  # checks if coordinate doesnt exceed world boundary
@@ -185,32 +210,24 @@ class World:
                 room_map[9][9] = 130
 
     def random_floor_layout(self, room_map):
-        w = [10, 1, 1, 1, 1, 0.2, 0.2, 0.2]
-        floor_tiles = [129, 130, 131, 161, 162, 163, 193, 194]
-        for x in range(len(room_map)):
-            for y in range(len(room_map[0])):
-                if int(room_map[x][y]) in utils.floor_tiles:
-                    room_map[x][y] = random.choices(utils.floor_tiles, w, k=1)[0]
+        floor = numpy.isin(room_map, utils.floor_tiles)
+        room_map[floor] = self.random.choice(utils.floor_tiles, size=numpy.count_nonzero(floor),
+                                             p=self.floor_weights / self.floor_weights.sum())
 
     def add_room_map(self, file):
-        with open(f'./maps/{file}.csv', newline='') as f:  # load room template
-            reader = csv.reader(f)
-            basic_map = list(reader)
-
+        basic_map = load_room_template(file)
         for row in self.world:  # make passage through rooms
             for room in row:
                 if isinstance(room, Room):
-                    room_map = copy.deepcopy(basic_map)  # csv file
+                    room_map = basic_map.copy()
                     if file == 'floor_layer':
                         self.random_floor_layout(room_map)
                     self.shut_doors(room.doors, room_map, file)
                     room.room_map.append(room_map)
 
-    def add_graphics(self):
-        for row in self.world:
-            for room in row:
-                if isinstance(room, Room):
-                    room.tile_map = TileMap(room, room.room_map, Spritesheet('./assets/misc/spritesheet.png'))
+    @staticmethod
+    def add_graphics(room):
+        room.tile_map = TileMap(room, room.room_map, get_tile_atlas())
 
     def assign_objects(self):
         for row in self.world:
@@ -1,6 +1,5 @@
 from .map_generator import World
 import src.utils as utils
-import pygame
 
 
 class WorldManager:
@@ -21,10 +20,15 @@ class WorldManager:
         self.direction, self.value = None, None
         self.new_level = False
         self.move_current_room = False
+        self.next_world = None  # world of the next level, built a step per update while this level is played
+        self.next_world_builder = None
         self.load_world_manager()
 
     def load_world_manager(self):
-        self.world = World(self, self.game, self.number_of_rooms, self.world_width, self.world_height)
+        self.set_world(World(self, self.game, self.number_of_rooms, self.world_width, self.world_height))
+
+    def set_world(self, world):
+        self.world = world
         self.x, self.y = self.world.starting_room.x, self.world.starting_room.y
         self.current_room = self.world.starting_room
         self.current_map = self.current_room.tile_map
@@ -32,6 +36,23 @@ class WorldManager:
         self.next_room_map = None
         self.switch_room = False
         self.direction, self.value = None, None
+        self.prepare_next_level()
+
+    def prepare_next_level(self):
+        self.next_world = World(self, self.game, self.number_of_rooms, self.world_width, self.world_height,
+                                level=self.level + 1, staged=True)
+        self.next_world_builder = self.build_next_level()
+
+    def build_next_level(self):
+        yield from self.next_world.build()
+        yield from self.game.enemy_manager.spawn_enemies(self.next_world, self.next_world.level)
+
+    def load_next_level(self):
+        """Switches to the pre-built world, finishing whatever is left of building it"""
+        for _ in self.next_world_builder:
+            pass
+        self.set_world(self.next_world)
+        self.game.enemy_manager.upgrade_enemies(self.world)
 
     def set_current_room(self, room):
         self.current_room = room
@@ -42,10 +63,10 @@ class WorldManager:
         if room:
             self.next_room_map = room.tile_map
 
-    def draw_map(self, surface):
-        self.current_map.draw_map(surface)
+    def draw_map(self, surface, rects=None):
+        self.current_map.draw_map(surface, rects)
         if self.next_room:
-            self.next_room_map.draw_map(surface)
+            self.next_room_map.draw_map(surface, rects)
 
     def move_entities(self, direction, value, anim_speed=30):
         if direction in ('up', 'down'):
@@ -64,6 +85,7 @@ class WorldManager:
         self.end_condition()
 
     def update(self):
+        next(self.next_world_builder, None)
         self.detect_next_room()
         if self.switch_room:
             self.move_rooms(self.direction, self.value)
@@ -145,12 +167,12 @@ class WorldManager:
         if self.current_map.x > 1100:
             self.new_level = False
             self.level += 1
-            self.load_world_manager()
+            self.load_next_level()
             self.current_map.x = -20 * 64
             self.move_current_room = True
             self.game.player.fall(-300)
-            self.game.enemy_manager.add_enemies()
-            self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/Intro.wav'))
+            self.game.sound_manager.play('intro')
+            self.game.sound_manager.play_level_music(self.level)
 
     def move_current_rom(self):
         anim_speed = 30
@@ -12,7 +12,6 @@ class Button:
         self.rect = self.image.get_rect()
         self.rect.midtop = (x, y)
         self.clicked = False
-        self.sound = pygame.mixer.Sound('./assets/sound/menu select.wav')
         self.played = False
 
     def load_images(self):
@@ -35,7 +34,7 @@ class Button:
 
     def play_sound(self):
         if not self.played:
-            pygame.mixer.Sound.play(self.sound)
+            self.menu.game.sound_manager.play('menu_select')
             self.played = True
 
     def draw(self, surface):
@@ -91,6 +90,7 @@ class MainMenu:
 
     def draw(self):
         self.game.screen.fill((0, 0, 0))
+        self.game.background.render()
         self.game.background.draw(self.game.screen)
         self.play_button.draw(self.game.screen)
         self.exit_button.draw(self.game.screen)
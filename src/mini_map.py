@@ -61,17 +61,17 @@ class MiniMap:
         for i, room in enumerate(self.visited_rooms):
             position = (self.offset_x + room[1] * self.room_width * 1.2,
                         self.offset_y + room[0] * self.room_height * 1.2)
-            pygame.draw.rect(surface, self.color, (*position, *self.room_dimensions), 4)
+            self.game.add_dirty_rect(pygame.draw.rect(surface, self.color, (*position, *self.room_dimensions), 4))
         position = (self.offset_x + self.current_room.y * self.room_width * 1.2,
                     self.offset_y + self.current_room.x * self.room_height * 1.2)
-        pygame.draw.rect(surface, (210, 210, 210,), (*position, *self.room_dimensions))
+        self.game.add_dirty_rect(pygame.draw.rect(surface, (210, 210, 210,), (*position, *self.room_dimensions)))
 
     def draw(self, surface):
         if self.draw_mini_map:
             for room in self.adjacent_rooms:
                 position = (self.offset_x + room[1] * self.room_width * 1.2,
                             self.offset_y + room[0] * self.room_height * 1.2)
-                pygame.draw.rect(surface, self.color, (*position, *self.room_dimensions), 4)
+                self.game.add_dirty_rect(pygame.draw.rect(surface, self.color, (*position, *self.room_dimensions), 4))
             position = (self.offset_x + self.current_y * self.room_width * 1.2,
                         self.offset_y + self.current_x * self.room_height * 1.2)
-            pygame.draw.rect(surface, (210, 210, 210,), (*position, *self.room_dimensions))
+            self.game.add_dirty_rect(pygame.draw.rect(surface, (210, 210, 210,), (*position, *self.room_dimensions)))
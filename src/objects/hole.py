@@ -1,4 +1,4 @@
-import pygame
+import src.utils as utils
 from .object import Object
 
 
@@ -8,7 +8,7 @@ class Hole:
         self.game = game
         self.room = room
         self.image = None
-        self.image_picked = pygame.image.load('./assets/objects/passage/passage_picked.png').convert_alpha()
+        self.image_picked = utils.load_image('./assets/objects/passage/passage_picked.png')
         self.images = []
         self.load_image()
         self.position = position
@@ -22,8 +22,7 @@ class Hole:
 
     def load_image(self):
         for i in range(5):
-            image = pygame.image.load(f'./assets/objects/passage/passage{i}.png').convert_alpha()
-            self.images.append(image)
+            self.images.append(utils.load_image(f'./assets/objects/passage/passage{i}.png'))
         self.image = self.images[0]
 
     def update_animation_frame(self):
@@ -34,7 +33,7 @@ class Hole:
 
     def interact(self):
         self.game.world_manager.load_new_level()
-        self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/Explosion3.wav'))
+        self.game.sound_manager.play('hole')
 
     def detect_collision(self):
         if self.game.player.hitbox.colliderect(self.rect) and self.game.player.interaction:
@@ -50,4 +49,4 @@ class Hole:
 
     def draw(self):
         surface = self.room.tile_map.map_surface
-        surface.blit(self.image, (self.rect.x, self.rect.y))
+        self.room.tile_map.add_dirty_rect(surface.blit(self.image, (self.rect.x, self.rect.y)))
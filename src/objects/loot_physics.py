@@ -0,0 +1,121 @@
+import math
+import random
+import numpy
+
+ROOM_LEFT = 198 + 10
+ROOM_RIGHT = 1136
+ROOM_BOTTOM = 654
+
+
+class Bounce:
+    """Bounce state of one dropped item, it lives in a row of LootPhysics arrays until the item settles"""
+
+    def __init__(self, physics, slot):
+        self.physics = physics
+        self.slot = slot
+        self.position = (0, 0)  # where the item settled
+
+    @property
+    def x(self):
+        return self.physics.pos[self.slot, 0] if self.slot is not None else self.position[0]
+
+    @x.setter
+    def x(self, value):
+        if self.slot is not None:
+            self.physics.pos[self.slot, 0] = value
+
+    @property
+    def y(self):
+        return self.physics.pos[self.slot, 1] if self.slot is not None else self.position[1]
+
+    @y.setter
+    def y(self, value):
+        if self.slot is not None:
+            self.physics.pos[self.slot, 1] = value
+
+    def reset(self):
+        self.physics.release(self)
+
+
+class LootPhysics:
+    """Moves all dropped items together, velocity is kept as (x, y) so a step is only additions and products"""
+    substeps = 15
+    gravity = 0.002
+    drag = 0.999
+    min_speed = 0.004  # items slower than this have settled
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.bounces = {}  # slot: Bounce
+        self.pos = numpy.zeros((capacity, 2))
+        self.vel = numpy.zeros((capacity, 2))
+        self.elasticity = numpy.zeros(capacity)
+        self.limit = numpy.zeros(capacity)  # floor the item bounces off
+        self.bottom = numpy.zeros(capacity)
+        self.left = numpy.zeros(capacity)
+        self.right = numpy.zeros(capacity)
+        self.free_slots = list(range(capacity - 1, -1, -1))
+
+    def grow(self):
+        self.free_slots.extend(range(2 * self.capacity - 1, self.capacity - 1, -1))
+        self.capacity *= 2
+        for name in ('pos', 'vel', 'elasticity', 'limit', 'bottom', 'left', 'right'):
+            array = getattr(self, name)
+            grown = numpy.zeros((self.capacity,) + array.shape[1:])
+            grown[:len(array)] = array
+            setattr(self, name, grown)
+
+    def add(self, x, y, limit, size=None, speed=(0.5, 0.6), spread=10):
+        """Throws an item up at a random angle of at most spread / 10 radians from vertical.
+        Items without size ignore the room walls and only bounce off their limit"""
+        if not self.free_slots:
+            self.grow()
+        slot = self.free_slots.pop()
+        speed = random.uniform(*speed)
+        angle = random.randint(-spread, spread) / 10
+        self.pos[slot] = x, y
+        self.vel[slot] = math.sin(angle) * speed, -math.cos(angle) * speed
+        self.elasticity[slot] = random.uniform(0.75, 0.9)
+        self.limit[slot] = limit
+        if size:
+            self.bottom[slot] = ROOM_BOTTOM - size[0]
+            self.left[slot], self.right[slot] = ROOM_LEFT, ROOM_RIGHT - size[0]
+        else:
+            self.bottom[slot], self.left[slot], self.right[slot] = math.inf, -math.inf, math.inf
+        bounce = Bounce(self, slot)
+        self.bounces[slot] = bounce
+        return bounce
+
+    def release(self, bounce):
+        if bounce.slot is None:
+            return
+        bounce.position = tuple(self.pos[bounce.slot])
+        del self.bounces[bounce.slot]
+        self.free_slots.append(bounce.slot)
+        bounce.slot = None
+
+    def update(self):
+        if not self.bounces:
+            return
+        slots = numpy.fromiter(self.bounces, dtype=int)
+        pos, vel, elasticity = self.pos[slots], self.vel[slots], self.elasticity[slots]
+        limit, bottom, left, right = self.limit[slots], self.bottom[slots], self.left[slots], self.right[slots]
+        x, y = pos[:, 0], pos[:, 1]
+        for _ in range(self.substeps):
+            vel[:, 1] += self.gravity
+            pos += vel
+            vel *= self.drag
+            floor = numpy.where(y > limit, limit, numpy.where(y > bottom, bottom, numpy.nan))
+            wall = numpy.where(x < left, left, numpy.where(x > right, right, numpy.nan))
+            hit_floor, hit_wall = ~numpy.isnan(floor), ~numpy.isnan(wall)
+            if hit_floor.any():
+                y[hit_floor] = 2 * floor[hit_floor] - y[hit_floor]
+                vel[hit_floor, 1] *= -1
+                vel[hit_floor] *= elasticity[hit_floor, None]
+            if hit_wall.any():
+                x[hit_wall] = 2 * wall[hit_wall] - x[hit_wall]
+                vel[hit_wall, 0] *= -1
+                vel[hit_wall] *= elasticity[hit_wall, None]
+        self.pos[slots], self.vel[slots] = pos, vel
+        for slot in slots[numpy.hypot(vel[:, 0], vel[:, 1]) < self.min_speed].tolist():
+            self.release(self.bounces[slot])
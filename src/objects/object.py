@@ -1,8 +1,7 @@
 import pygame
-from src.utils import get_mask_rect
+from src.utils import get_mask_rect, get_cached_mask_rect
 import src.utils as utils
 import random
-import math
 
 
 class ShowName:
@@ -24,28 +23,32 @@ class ShowName:
             return True
 
     def draw(self, surface, rect):
-        self.draw_text_line(surface, rect)
-        self.draw_text(surface)
+        """Draws name next to the object, returns part of the surface drawn on"""
+        line_rect = self.draw_text_line(surface, rect)
+        return line_rect.union(self.draw_text(surface))
 
     def draw_text(self, surface):
-        text_surface = pygame.font.Font(utils.font, 15).render(self.text[:self.counter], True, (255, 255, 255))
-        surface.blit(text_surface, self.text_position)
+        text_surface = utils.render_text(self.text[:self.counter], 15)
+        return surface.blit(text_surface, self.text_position)
 
     def draw_text_line(self, surface, rect):
         starting_position = [rect.topleft[0], rect.topleft[1]]  # starting position of diagonal line
+        line_rect = pygame.Rect(starting_position, (0, 0))
         for _ in range(5):  # we draw rectangles in diagonal line, so the line looks pixelated
             starting_position[0] -= 5
             starting_position[1] -= 5
-            pygame.draw.rect(surface, (255, 255, 255), (starting_position[0], starting_position[1], 5, 5))
+            line_rect.union_ip(pygame.draw.rect(surface, (255, 255, 255),
+                                                (starting_position[0], starting_position[1], 5, 5)))
 
         starting_position[1] += 2  # adjustment of vertical position
         end_position = [starting_position[0] - self.line_length, starting_position[1]]
-        pygame.draw.line(surface, (255, 255, 255), starting_position, end_position, 5)
+        line_rect.union_ip(pygame.draw.line(surface, (255, 255, 255), starting_position, end_position, 5))
         if self.line_length <= self.text_length * 8 and self.time_passed(self.time, 15):
             self.time = pygame.time.get_ticks()
             self.line_length += 8
             self.counter += 1
         self.text_position = (end_position[0], end_position[1] - 20)
+        return line_rect
 
     def reset_line_length(self):
         self.line_length = 0
@@ -74,9 +77,7 @@ class ShowPrice(ShowName):
 
     def load_image(self):
         for i in range(4):
-            image = pygame.image.load(f'./assets/objects/coin/coin/coin{i}.png').convert_alpha()
-            image = pygame.transform.scale(image, self.image_size)
-            self.images.append(image)
+            self.images.append(utils.load_image(f'./assets/objects/coin/coin/coin{i}.png', self.image_size))
         self.image = self.images[0]
 
     def update_animation_frame(self):
@@ -91,13 +92,13 @@ class ShowPrice(ShowName):
         self.update_animation_frame()
 
     def draw_text(self, surface):
-        text_surface = pygame.font.Font(utils.font, 18).render(self.text, True, (255, 255, 255))
-        surface.blit(text_surface, self.text_position)
+        text_surface = utils.render_text(self.text, 18)
+        return surface.blit(text_surface, self.text_position)
 
     def draw(self, surface):
         if self.object.for_sale:
-            surface.blit(self.image, self.image_rect)
-            self.draw_text(surface)
+            image_rect = surface.blit(self.image, self.image_rect)
+            return image_rect.union(self.draw_text(surface))
 
 
 class Hovering:
@@ -142,12 +143,8 @@ class Shadow:
         self.correct = correct
 
     def draw_shadow(self, surface):
-        color = (0, 0, 0, 120)
-        shape_surf = pygame.Surface((50, 50), pygame.SRCALPHA).convert_alpha()
-        pygame.draw.ellipse(shape_surf, color, (
-            self.position / 3, 0, self.shadow_width / 2 + 4 + self.correct + self.position, 10 + self.position))
-        shape_surf = pygame.transform.scale(shape_surf, (100, 100))
-        surface.blit(shape_surf, self.shadow_position)
+        ellipse = (self.position / 3, 0, self.shadow_width / 2 + 4 + self.correct + self.position, 10 + self.position)
+        return utils.draw_shadow(surface, self.shadow_position, ellipse)
 
     def set_shadow_position(self, value=0):
         self.shadow_position = [self.object.hitbox.midbottom[0] - 16 + value, self.object.hitbox.midbottom[1]]
@@ -186,42 +183,34 @@ class Object:
         return self.name
 
     def activate_bounce(self):
-        self.bounce = Bounce(self.rect.x, self.rect.y, self.rect.y + random.randint(0, 123), self.size)
+        self.bounce = self.game.object_manager.loot_physics.add(self.rect.x, self.rect.y,
+                                                                self.rect.y + random.randint(0, 123), self.size)
 
     def draw_shadow(self, surface, value=0):
         if self.dropped:
             self.shadow.set_shadow_position(value)
-            self.shadow.draw_shadow(surface)
+            return self.shadow.draw_shadow(surface)
         else:
             if not self.shadow.shadow_set:
                 self.shadow.set_shadow_position(value)
             if self.player:
                 self.shadow.shadow_set = False
             if self.player is None:
-                self.shadow.draw_shadow(surface)
+                return self.shadow.draw_shadow(surface)
 
     def update_bounce(self):
         if not self.bounce:
             return
-        if self.bounce.speed < 0.004:
+        if self.bounce.slot is None:
             self.dropped = False
-            self.bounce.reset()
         elif self.dropped:
-            for _ in range(15):
-                self.bounce.move()
-                self.bounce.bounce()
             self.rect.x = self.bounce.x
             self.rect.y = self.bounce.y
 
     def load_image(self):
-        self.original_image = pygame.image.load(
-            f'{self.path}/{self.name}.png').convert_alpha()
-        self.original_image = pygame.transform.scale(self.original_image, self.size)
-        self.image_picked = pygame.image.load(
-            f'{self.path}/{self.name}_picked.png').convert_alpha()
-        self.image_picked = pygame.transform.scale(self.image_picked, self.size)
-        self.hud_image = pygame.image.load(
-            f'{self.path}/{self.name}_hud.png').convert_alpha()
+        self.original_image = utils.load_image(f'{self.path}/{self.name}.png', self.size)
+        self.image_picked = utils.load_image(f'{self.path}/{self.name}_picked.png', self.size)
+        self.hud_image = utils.load_image(f'{self.path}/{self.name}_hud.png')
         self.image = self.original_image
 
     def detect_collision(self):
@@ -247,7 +236,7 @@ class Object:
         pass
 
     def update_hitbox(self):
-        self.hitbox = get_mask_rect(self.image, *self.rect.topleft)
+        self.hitbox = get_cached_mask_rect(self.image, *self.rect.topleft)
         self.hitbox.midbottom = self.rect.midbottom
 
     def interact(self):
@@ -263,65 +252,11 @@ class Object:
             self.for_sale = False
 
     def draw(self):
-        surface = self.room.tile_map.map_surface
+        tile_map = self.room.tile_map
+        surface = tile_map.map_surface
         # self.room.tile_map.map_surface.blit(self.image, (self.rect.x + 64, self.rect.y + 32))
-        surface.blit(self.image, (self.rect.x, self.rect.y))
+        tile_map.add_dirty_rect(surface.blit(self.image, (self.rect.x, self.rect.y)))
         if self.interaction:
-            self.show_name.draw(surface, self.rect)
+            tile_map.add_dirty_rect(self.show_name.draw(surface, self.rect))
         if self.dropped:
-            self.shadow.draw_shadow(surface)
-
-
-class Bounce:
-    def __init__(self, x, y, limit, size):
-        self.speed = random.uniform(0.5, 0.6)  # 0.5
-        self.angle = random.randint(-10, 10) / 10  # random.choice([10, -10])
-        self.drag = 0.999
-        self.elasticity = random.uniform(0.75, 0.9)  # 0.75
-        self.gravity = (math.pi, 0.002)
-        self.limit = limit
-        self.limits = [limit, 654]
-        self.x, self.y = x, y
-        self.size = size
-
-    @staticmethod
-    def add_vectors(angle1, length1, angle2, length2):
-        x = math.sin(angle1) * length1 + math.sin(angle2) * length2
-        y = math.cos(angle1) * length1 + math.cos(angle2) * length2
-        angle = 0.5 * math.pi - math.atan2(y, x)
-        length = math.hypot(x, y)
-        return angle, length
-
-    def move(self):
-        self.angle, self.speed = self.add_vectors(self.angle, self.speed, *self.gravity)
-        self.x += math.sin(self.angle) * self.speed
-        self.y -= math.cos(self.angle) * self.speed
-        self.speed *= self.drag
-
-    def bounce(self):
-        # if self.y > any(self.limits):
-        if self.y > self.limit:
-            self.y = 2 * self.limit - self.y
-            self.angle = math.pi - self.angle
-            self.speed *= self.elasticity
-
-        elif self.y > 654 - self.size[0]:
-            self.y = 2 * (654 - self.size[0]) - self.y
-            self.angle = math.pi - self.angle
-            self.speed *= self.elasticity
-
-        if self.x < 198 + 10:
-            self.x = 2 * (198 + 10) - self.x
-            self.angle = - self.angle
-            self.speed *= self.elasticity
-
-        elif self.x > 1136 - self.size[0]:
-            self.x = 2 * (1136 - self.size[0]) - self.x
-            self.angle = - self.angle
-            self.speed *= self.elasticity
-
-    def reset(self):
-        self.speed = 0.5
-        self.angle = random.choice([10, -10])
-        self.drag = 0.999
-        self.elasticity = 0.75
+            tile_map.add_dirty_rect(self.shadow.draw_shadow(surface))
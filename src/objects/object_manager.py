@@ -1,4 +1,5 @@
 import pygame
+from .loot_physics import LootPhysics
 
 
 class ObjectManager:
@@ -10,6 +11,7 @@ class ObjectManager:
         pygame.time.set_timer(pygame.USEREVENT, 500)
         self.hover = False
         self.position = 0
+        self.loot_physics = LootPhysics()
 
     def set_current_objects(self):
         self.current_objects.clear()
@@ -33,6 +35,7 @@ class ObjectManager:
 
     def update(self):
         self.set_current_objects()
+        self.loot_physics.update()
         for o in self.current_objects:
             if self.interaction:
                 o.detect_collision()
@@ -1,4 +1,4 @@
-import pygame
+import src.utils as utils
 from .object import Object
 
 class Poop(Object):
@@ -12,11 +12,11 @@ class Poop(Object):
         self.bounce = None
 
     def load_image(self):
-        self.image = pygame.image.load('./assets/objects/poop/poop.png').convert_alpha()
+        self.image = utils.load_image('./assets/objects/poop/poop.png')
 
     def detect_collision(self):
         pass
 
     def draw(self):
         surface = self.room.tile_map.map_surface
-        surface.blit(self.image, (self.rect.x, self.rect.y))
+        self.room.tile_map.add_dirty_rect(surface.blit(self.image, (self.rect.x, self.rect.y)))
@@ -1,4 +1,4 @@
-import pygame
+import src.utils as utils
 from .object import Object
 import random
 from src.particles import PowerUpAttackParticle, ShieldParticle
@@ -20,17 +20,14 @@ class PowerUp(Object):
         self.particles = []
 
     def load_image(self):
-        image = pygame.image.load(f'./assets/objects/power_ups/{self.name}/{self.name}.png').convert_alpha()
-        image = pygame.transform.scale(image, self.size)
-        self.image = image
+        self.image = utils.load_image(f'./assets/objects/power_ups/{self.name}/{self.name}.png', self.size)
 
     def detect_collision(self):
         if self.game.player.rect.colliderect(self.rect):
-            self.image = pygame.image.load(
-                f'./assets/objects/power_ups/{self.name}/{self.name}_picked.png').convert_alpha()
+            self.image = utils.load_image(f'./assets/objects/power_ups/{self.name}/{self.name}_picked.png')
             self.interaction = True
         else:
-            self.image = pygame.image.load(f'./assets/objects/power_ups/{self.name}/{self.name}.png').convert_alpha()
+            self.image = utils.load_image(f'./assets/objects/power_ups/{self.name}/{self.name}.png')
             self.interaction = False
             self.show_name.reset_line_length()
 
@@ -44,13 +41,14 @@ class PowerUp(Object):
         self.update_bounce()
 
     def draw(self):
-        surface = self.room.tile_map.map_surface
-        surface.blit(self.image, (self.rect.x, self.rect.y))
+        tile_map = self.room.tile_map
+        surface = tile_map.map_surface
+        tile_map.add_dirty_rect(surface.blit(self.image, (self.rect.x, self.rect.y)))
         self.beautify(surface)
         if self.interaction:
-            self.show_name.draw(surface, self.rect)
-        self.show_price.draw(surface)
-        self.draw_shadow(surface, -12)
+            tile_map.add_dirty_rect(self.show_name.draw(surface, self.rect))
+        tile_map.add_dirty_rect(self.show_price.draw(surface))
+        tile_map.add_dirty_rect(self.draw_shadow(surface, -12))
 
     def beautify(self, surface):
         pass
@@ -66,13 +64,13 @@ class AttackPowerUp(PowerUp):
     def interact(self):
         self.game.player.strength *= 1.1
         self.room.objects.remove(self)
-        self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/PowerUp.wav'))
+        self.game.sound_manager.play('power_up')
 
     def beautify(self, surface):
         if random.randint(1, 20) == 1:
             x = random.randint(self.rect.midtop[0] - 30, self.rect.midtop[0] + 30)
             y = random.randint(self.rect.midtop[1] - 30, self.rect.midtop[1] + 30)
-            self.game.particle_manager.particle_list.append(PowerUpAttackParticle(self.game, x, y))
+            self.game.particle_manager.add_particle(PowerUpAttackParticle(self.game, x, y))
 
 
 class ShieldPowerUp(PowerUp):
@@ -85,10 +83,10 @@ class ShieldPowerUp(PowerUp):
     def interact(self):
         self.game.player.shield += 1
         self.room.objects.remove(self)
-        self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/PowerUp.wav'))
+        self.game.sound_manager.play('power_up')
 
     def beautify(self, surface):
         if random.randint(1, 10) == 1:
             x = random.randint(self.hitbox.midtop[0] - 10, self.rect.midtop[0] + 10)
             y = random.randint(self.hitbox.midtop[1] - 10, self.rect.midtop[1] + 10)
-            self.game.particle_manager.particle_list.append(ShieldParticle(self.game, x, y))
+            self.game.particle_manager.add_particle(ShieldParticle(self.game, x, y))
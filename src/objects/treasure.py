@@ -0,0 +1,30 @@
+import numpy.random
+from src.objects.weapon import AnimeSword, FireSword, Staff
+from .flask import RedFlask, GreenFlask
+from .power_up import AttackPowerUp, ShieldPowerUp
+
+rare_items = (AnimeSword, RedFlask, ShieldPowerUp, AttackPowerUp, GreenFlask, FireSword, Staff)
+rare_item_chances = (0.03, 0.01, 0.2, 0.2, 0.5, 0.03, 0.03)
+
+
+class Treasure:
+    """Item carried by an enemy or a chest, it stays a record until it is dropped"""
+    __slots__ = ('kind', 'value')
+
+    def __init__(self, kind, value=None):
+        self.kind = kind
+        self.value = value
+
+    def create(self, game, room):
+        item = self.kind(game, room)
+        if self.value is not None:
+            item.value = self.value
+        return item
+
+    def __repr__(self):
+        return f'Treasure({self.kind.__name__})'
+
+
+def choose_rare_items(count):
+    """Kinds of items offered by a chest or a merchant, each at most once"""
+    return numpy.random.choice(rare_items, size=count, replace=False, p=rare_item_chances)
@@ -5,12 +5,37 @@ import pygame
 from pygame.math import Vector2
 from src.utils import get_mask_rect
 import src.utils
-from PIL import Image
 from .object import Object
 from src.particles import ParticleManager, Fire
 from src.bullet import StaffBullet
 
 
+class RotationCache:
+    """Rotations of one weapon image and their masks, built lazily for angles rounded to 'step' degrees.
+    Holds at most 360 / step rotations, so it is never evicted"""
+
+    def __init__(self, image, step=2):
+        self.image = image
+        self.step = step
+        self.rotations = {}  # angle index: (rotated image, its mask)
+
+    def get(self, angle):
+        key = round(angle / self.step) % (360 // self.step)
+        if key not in self.rotations:
+            rotated_image = pygame.transform.rotozoom(self.image, key * self.step, 1)
+            self.rotations[key] = rotated_image, pygame.mask.from_surface(rotated_image)
+        return self.rotations[key]
+
+
+rotation_caches = {}  # image: its RotationCache, images come from the registry so weapons of a kind share them
+
+
+def get_rotation_cache(image):
+    if image not in rotation_caches:
+        rotation_caches[image] = RotationCache(image)
+    return rotation_caches[image]
+
+
 class WeaponSwing:
     left_swing = 10
     right_swing = -190
@@ -26,7 +51,8 @@ class WeaponSwing:
     def reset(self):
         self.counter = 0
 
-    def rotate(self, weapon=None):
+    def rotate(self, rotations=None):
+        """Points the weapon at the mouse, rotations default to those of weapon's original image"""
         mx, my = pygame.mouse.get_pos()
         dx = mx - self.weapon.player.hitbox.centerx  # - 64
         dy = my - self.weapon.player.hitbox.centery  # - 32
@@ -36,24 +62,19 @@ class WeaponSwing:
             self.angle = (180 / math.pi) * math.atan2(self.swing_side * dy, dx) + self.right_swing
 
         position = self.weapon.player.hitbox.center
-        if weapon:
-            self.weapon.image = pygame.transform.rotozoom(self.weapon.image, self.angle, 1)
-        else:
-            self.weapon.image = pygame.transform.rotozoom(self.weapon.original_image, self.angle, 1)
+        rotations = rotations or get_rotation_cache(self.weapon.original_image)
+        self.weapon.image, self.weapon.mask = rotations.get(self.angle)
 
         offset_rotated = self.offset.rotate(-self.angle)
         self.weapon.rect = self.weapon.image.get_rect(center=position + offset_rotated)
-        self.weapon.hitbox = pygame.mask.from_surface(self.weapon.image)
         self.offset_rotated = Vector2(0, -35).rotate(-self.angle)
 
     def swing(self):
         self.angle += 20 * self.swing_side
         position = self.weapon.player.hitbox.center
-        self.weapon.image = pygame.transform.rotozoom(self.weapon.original_image, self.angle, 1)
+        self.weapon.image, self.weapon.mask = get_rotation_cache(self.weapon.original_image).get(self.angle)
         offset_rotated = self.offset.rotate(-self.angle)
         self.weapon.rect = self.weapon.image.get_rect(center=position + offset_rotated)
-        # self.rect_mask = get_mask_rect(self.image, *self.rect.topleft)
-        self.weapon.hitbox = pygame.mask.from_surface(self.weapon.image)
         self.counter += 1
 
 
@@ -72,16 +93,20 @@ class Weapon(Object):
 
     def load_image(self):
         """Load weapon image and initialize instance variables"""
-        self.size = tuple(self.scale * x for x in Image.open(f'./assets/objects/weapon/{self.name}/{self.name}.png').size)
-        self.original_image = pygame.image.load(f'./assets/objects/weapon/{self.name}/{self.name}.png').convert_alpha()
-        self.original_image = pygame.transform.scale(self.original_image, self.size)
-        self.image_picked = pygame.image.load(f'./assets/objects/weapon/{self.name}/picked_{self.name}.png').convert_alpha()
-        self.image_picked = pygame.transform.scale(self.image_picked, self.size)
-        self.hud_image = pygame.image.load(f'./assets/objects/weapon/{self.name}/{self.name}_hud.png').convert_alpha()
+        path = f'./assets/objects/weapon/{self.name}'
+        self.size = tuple(self.scale * x for x in src.utils.load_image(f'{path}/{self.name}.png').get_size())
+        self.original_image = src.utils.load_image(f'{path}/{self.name}.png', self.size)
+        self.image_picked = src.utils.load_image(f'{path}/picked_{self.name}.png', self.size)
+        self.hud_image = src.utils.load_image(f'{path}/{self.name}_hud.png')
+        self.flipped_image = src.utils.load_image(f'{path}/{self.name}.png', self.size, flip=True)
         self.image = self.original_image
         self.rect = self.image.get_rect()
         self.hitbox = get_mask_rect(self.original_image, *self.rect.topleft)
 
+    def flip_image(self):
+        """Swap image to the other side after a swing, flipped image is made once in load_image"""
+        self.original_image, self.flipped_image = self.flipped_image, self.original_image
+
     def detect_collision(self):
         if self.game.player.hitbox.colliderect(self.rect):
             self.image = self.image_picked
@@ -120,9 +145,10 @@ class Weapon(Object):
         self.weapon_swing.offset_rotated = Vector2(0, -25)
 
     def enemy_collision(self):
-        for enemy in self.game.enemy_manager.enemy_list:
+        for enemy in self.game.enemy_manager.nearby_enemies(self.rect):
             if (
-                    pygame.sprite.collide_mask(self.game.player.weapon, enemy)
+                    self.rect.colliderect(enemy.rect)
+                    and pygame.sprite.collide_mask(self.game.player.weapon, enemy)
                     and enemy.dead is False
                     and enemy.can_get_hurt_from_weapon()
             ):
@@ -136,7 +162,7 @@ class Weapon(Object):
     def player_update(self):
         self.interaction = False
         if self.weapon_swing.counter == 10:
-            self.original_image = pygame.transform.flip(self.original_image, 1, 0)
+            self.flip_image()
             self.player.attacking = False
             self.weapon_swing.counter = 0
         if self.player.attacking and self.weapon_swing.counter <= 10:
@@ -148,14 +174,21 @@ class Weapon(Object):
     def draw_shadow(self, surface):
         if self.dropped:
             self.shadow.set_shadow_position()
-            self.shadow.draw_shadow(surface)
+            return self.shadow.draw_shadow(surface)
         else:
             if not self.shadow.shadow_set:
                 self.shadow.set_shadow_position()
             if self.player:
                 self.shadow.shadow_set = False
             if self.player is None:
-                self.shadow.draw_shadow(surface)
+                return self.shadow.draw_shadow(surface)
+
+    def add_dirty_rect(self, rect):
+        """Held weapon is drawn on the screen, otherwise on the map of its room"""
+        if self.player:
+            self.game.add_dirty_rect(rect)
+        else:
+            self.room.tile_map.add_dirty_rect(rect)
 
     def update(self):
         self.hovering.hovering()
@@ -168,13 +201,15 @@ class Weapon(Object):
 
     def draw(self):
         surface = self.room.tile_map.map_surface
+        rect = self.rect
         if self.player:
             surface = self.game.screen
-        surface.blit(self.image, self.rect)
+            rect = self.rect.move(self.player.interpolation_offset())
+        self.add_dirty_rect(surface.blit(self.image, rect))
         if self.interaction:
-            self.show_name.draw(surface, self.rect)
-        self.show_price.draw(surface)
-        self.draw_shadow(surface)
+            self.add_dirty_rect(self.show_name.draw(surface, self.rect))
+        self.add_dirty_rect(self.show_price.draw(surface))
+        self.add_dirty_rect(self.draw_shadow(surface))
 
 
 class Staff(Weapon):
@@ -194,9 +229,8 @@ class Staff(Weapon):
 
     def load_images(self):
         for i in range(4):
-            image = pygame.image.load(f'./assets/objects/weapon/{self.name}/{self.name}{i}.png').convert_alpha()
-            image = pygame.transform.scale(image, self.size)
-            self.images.append(image)
+            self.images.append(src.utils.load_image(f'./assets/objects/weapon/{self.name}/{self.name}{i}.png', self.size))
+        self.frame_rotations = [get_rotation_cache(image) for image in self.images]  # by animation frame index
         self.image = self.images[0]
 
     def calculate_firing_position(self):
@@ -213,14 +247,13 @@ class Staff(Weapon):
         pos = pygame.mouse.get_pos()
         self.update_hitbox()
         self.calculate_firing_position()
-        self.game.bullet_manager.add_bullet(
-            StaffBullet(self.game, self, self.game.world_manager.current_room, self.firing_position[0],
-                        self.firing_position[1], pos))
-        self.game.sound_manager.play(pygame.mixer.Sound('./assets/sound/Shoot6.wav'))
+        self.game.bullet_manager.add_bullet(StaffBullet, self, self.game.world_manager.current_room,
+                                            self.firing_position[0], self.firing_position[1], pos)
+        self.game.sound_manager.play('staff_shoot')
 
     def player_update(self):
         self.interaction = False
-        self.weapon_swing.rotate(self)
+        self.weapon_swing.rotate(self.frame_rotations[int(self.animation_frame)])
         if self.player.attacking:
             self.fire()
             self.player.attacking = False
@@ -243,13 +276,15 @@ class Staff(Weapon):
 
     def draw(self):
         surface = self.room.tile_map.map_surface
+        rect = self.rect
         if self.player:
             surface = self.game.screen
-        surface.blit(self.image, self.rect)
+            rect = self.rect.move(self.player.interpolation_offset())
+        self.add_dirty_rect(surface.blit(self.image, rect))
         if self.interaction:
-            self.show_name.draw(surface, self.rect)
-        self.show_price.draw(surface)
-        self.draw_shadow(surface)
+            self.add_dirty_rect(self.show_name.draw(surface, self.rect))
+        self.add_dirty_rect(self.show_price.draw(surface))
+        self.add_dirty_rect(self.draw_shadow(surface))
 
 
 class AnimeSword(Weapon):
@@ -297,10 +332,12 @@ class AnimeSword(Weapon):
     def player_update(self):
         self.interaction = False
         if self.weapon_swing.counter == 10:
-            self.original_image = pygame.transform.flip(self.original_image, 1, 0)
+            self.flip_image()
             self.player.attacking = False
             self.weapon_swing.counter = 0
-            self.game.screen_position = (0, 0)
+            if self.game.screen_position != (0, 0):
+                self.game.screen_position = (0, 0)
+                self.game.full_refresh = True  # display is still shifted by the shake
         if self.player.attacking and self.weapon_swing.counter <= 10:
             self.weapon_swing.swing()
             self.enemy_collision()
@@ -354,7 +391,7 @@ class FireSword(Weapon):
     def player_update(self):
         self.interaction = False
         if self.weapon_swing.counter == 10:
-            self.original_image = pygame.transform.flip(self.original_image, 1, 0)
+            self.flip_image()
             self.player.attacking = False
             self.weapon_swing.counter = 0
         if self.player.attacking and self.weapon_swing.counter <= 10:
@@ -0,0 +1,263 @@
+import numpy
+import pygame
+
+CIRCLE, RECT = 0, 1
+
+FIELDS = ('x', 'y', 'vx', 'vy', 'radius', 'radius_decay', 'life', 'life_decay', 'jitter_scale', 'step_chance',
+          'drift', 'gravity', 'drag')
+INT_FIELDS = ('shape', 'size', 'color_start', 'color_count', 'target', 'jitter_x_min', 'jitter_x_max',
+              'jitter_y_min', 'jitter_y_max')
+
+
+offsets = {}  # (shape, size): pixel offsets of a stamp
+
+
+def get_offsets(shape, size):
+    """Pixel offsets covered by a filled circle of given radius or a square of given side"""
+    key = (shape, size)
+    if key not in offsets:
+        if shape == CIRCLE:
+            dx, dy = numpy.mgrid[-size:size, -size:size]
+            inside = (dx + 0.5) ** 2 + (dy + 0.5) ** 2 <= size ** 2
+            offsets[key] = dx[inside], dy[inside]
+        else:
+            dx, dy = numpy.mgrid[0:size, 0:size]
+            offsets[key] = dx.ravel(), dy.ravel()
+    return offsets[key]
+
+
+def stamp(pixels, shape, xs, ys, sizes, colors):
+    """Writes filled shapes into a surfarray pixel array, later shapes cover earlier ones of the same size.
+    Returns the bounding box (left, top, right, bottom) of written pixels or None"""
+    width, height = pixels.shape
+    box = None
+    for size in numpy.unique(sizes):
+        members = numpy.flatnonzero(sizes == size)
+        dx, dy = get_offsets(shape, int(size))
+        px = (xs[members, None] + dx).ravel()
+        py = (ys[members, None] + dy).ravel()
+        visible = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+        if not visible.any():
+            continue
+        px, py = px[visible], py[visible]
+        pixels[px, py] = numpy.repeat(colors[members], len(dx))[visible]
+        box = union_box(box, (int(px.min()), int(py.min()), int(px.max()) + 1, int(py.max()) + 1))
+    return box
+
+
+def union_box(box, other):
+    if box is None or other is None:
+        return box or other
+    return min(box[0], other[0]), min(box[1], other[1]), max(box[2], other[2]), max(box[3], other[3])
+
+
+def box_to_rect(box):
+    left, top, right, bottom = box
+    return pygame.Rect(left, top, right - left, bottom - top)
+
+
+class ParticleEngine:
+    """Stores every particle as a row in a set of numpy arrays, updates and draws them in batches"""
+    substeps = 5  # velocity and gravity are applied this many times per frame
+
+    def __init__(self, capacity=1024):
+        self.capacity = capacity
+        self.count = 0
+        self.random = numpy.random.default_rng()
+        self.palette = []
+        self.palette_index = {}  # colors tuple: start index in palette
+        self.targets = [None]  # rooms particles are drawn to, None is the current map
+        self.target_index = {None: 0}
+        for name in FIELDS:
+            setattr(self, name, numpy.zeros(capacity))
+        for name in INT_FIELDS:
+            setattr(self, name, numpy.zeros(capacity, dtype=numpy.int32))
+
+    def __len__(self):
+        return self.count
+
+    def grow(self):
+        self.capacity *= 2
+        for name in FIELDS + INT_FIELDS:
+            array = getattr(self, name)
+            grown = numpy.zeros(self.capacity, dtype=array.dtype)
+            grown[:self.count] = array[:self.count]
+            setattr(self, name, grown)
+
+    def get_color_range(self, colors):
+        colors = tuple(tuple(color[:3]) for color in colors)
+        if colors not in self.palette_index:
+            self.palette_index[colors] = len(self.palette)
+            self.palette.extend(colors)
+        return self.palette_index[colors], len(colors)
+
+    def get_target(self, room):
+        if room not in self.target_index:
+            self.target_index[room] = len(self.targets)
+            self.targets.append(room)
+        return self.target_index[room]
+
+    def emit(self, particle):
+        """Copies particle's attributes into a free row"""
+        if self.count == self.capacity:
+            self.grow()
+        i = self.count
+        for name in FIELDS:
+            getattr(self, name)[i] = getattr(particle, name)
+        self.shape[i] = RECT if particle.shape == 'rect' else CIRCLE
+        self.size[i] = particle.size
+        self.color_start[i], self.color_count[i] = self.get_color_range(particle.colors)
+        self.target[i] = self.get_target(particle.room)
+        (self.jitter_x_min[i], self.jitter_x_max[i]), (self.jitter_y_min[i], self.jitter_y_max[i]) = particle.jitter
+        self.count += 1
+
+    def update(self, player_velocity=0):
+        n = self.count
+        if not n:
+            return
+        moving = self.random.random(n) < self.step_chance[:n]
+        jitter_x = self.random.integers(self.jitter_x_min[:n], self.jitter_x_max[:n] + 1)
+        jitter_y = self.random.integers(self.jitter_y_min[:n], self.jitter_y_max[:n] + 1)
+        self.x[:n] += moving * jitter_x * self.jitter_scale[:n]
+        self.y[:n] += moving * jitter_y * self.jitter_scale[:n]
+        if player_velocity:
+            self.x[:n] -= numpy.sign(player_velocity) * self.drift[:n] * self.random.integers(1, 3, n)
+        vx, vy = self.vx[:n], self.vy[:n]
+        for _ in range(self.substeps):
+            vy += self.gravity[:n]
+            self.x[:n] += vx
+            self.y[:n] += vy
+            vx *= self.drag[:n]
+            vy *= self.drag[:n]
+        self.radius[:n] -= moving * self.radius_decay[:n]
+        self.life[:n] -= moving * self.life_decay[:n]
+        alive = (self.life[:n] > 0) & ((self.shape[:n] != CIRCLE) | (self.radius[:n] >= 1))
+        self.compact(alive)
+
+    def compact(self, alive):
+        """Moves surviving rows to the front of the arrays"""
+        survivors = numpy.flatnonzero(alive)
+        if len(survivors) == self.count:
+            return
+        for name in FIELDS + INT_FIELDS:
+            array = getattr(self, name)
+            array[:len(survivors)] = array[survivors]
+        self.count = len(survivors)
+        if not self.count:
+            del self.targets[1:]
+            self.target_index = {None: 0}
+
+    def draw(self, current_map):
+        """Stamps all particles onto their map surfaces and marks the covered area as dirty"""
+        n = self.count
+        if not n:
+            return
+        colors = self.color_start[:n] + self.random.integers(0, 1 << 16, n) % self.color_count[:n]
+        sizes = numpy.where(self.shape[:n] == CIRCLE, self.radius[:n].astype(numpy.int32), self.size[:n])
+        xs, ys = self.x[:n].astype(numpy.int32), self.y[:n].astype(numpy.int32)
+        for target in numpy.unique(self.target[:n]):
+            room = self.targets[target]
+            tile_map = current_map if room is None else room.tile_map
+            selected = numpy.flatnonzero(self.target[:n] == target)
+            rect = self.draw_group(tile_map.map_surface, selected, xs, ys, sizes, colors)
+            if rect:
+                tile_map.add_dirty_rect(rect)
+
+    def draw_group(self, surface, selected, xs, ys, sizes, colors):
+        mapped = numpy.array([surface.map_rgb(color) & 0xFFFFFFFF for color in self.palette], dtype=numpy.uint32)
+        try:
+            pixels = pygame.surfarray.pixels2d(surface)
+        except ValueError:
+            return self.draw_group_slow(surface, selected, xs, ys, sizes, colors)
+        box = None
+        shapes = self.shape[selected]
+        for shape in (CIRCLE, RECT):
+            group = selected[shapes == shape]
+            box = union_box(box, stamp(pixels, shape, xs[group], ys[group], sizes[group], mapped[colors[group]]))
+        del pixels
+        return box_to_rect(box) if box else None
+
+    def draw_group_slow(self, surface, selected, xs, ys, sizes, colors):
+        rect = None
+        for i in selected:
+            color = self.palette[colors[i]]
+            if self.shape[i] == CIRCLE:
+                drawn = pygame.draw.circle(surface, color, (xs[i], ys[i]), sizes[i])
+            else:
+                drawn = pygame.draw.rect(surface, color, (xs[i], ys[i], sizes[i], sizes[i]))
+            rect = rect.union(drawn) if rect else drawn
+        return rect
+
+
+class FireSystem:
+    """Fire particles kept in numpy arrays and rasterized into a quarter resolution buffer, which is scaled
+    up to achieve pixelated fire"""
+    colors = ((255, 255, 0), (255, 173, 51), (247, 117, 33), (191, 74, 46), (115, 61, 56), (61, 38, 48))
+    fields = ('x', 'y', 'life', 'max_life', 'radius', 'ox', 'oy')
+
+    def __init__(self, surface, capacity=256):
+        self.surface = surface
+        self.capacity = capacity
+        self.count = 0
+        self.random = numpy.random.default_rng()
+        self.mapped_colors = numpy.array([surface.map_rgb(color + (255,)) & 0xFFFFFFFF for color in self.colors],
+                                         dtype=numpy.uint32)
+        self.transparent = surface.map_rgb((0, 0, 0, 0)) & 0xFFFFFFFF
+        self.box = None  # part of the buffer drawn on in the last frame
+        for name in self.fields:
+            setattr(self, name, numpy.zeros(capacity))
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, fire):
+        if self.count == self.capacity:
+            self.capacity *= 2
+            for name in self.fields:
+                grown = numpy.zeros(self.capacity)
+                grown[:self.count] = getattr(self, name)[:self.count]
+                setattr(self, name, grown)
+        for name in self.fields:
+            getattr(self, name)[self.count] = getattr(fire, name)
+        self.count += 1
+
+    def update(self):
+        n = self.count
+        if not n:
+            return
+        active = self.random.integers(0, 4, n) == 0
+        self.life[:n] -= active
+        self.y[:n] -= 0.7 * active
+        self.radius[:n] += 0.2 * (active & (self.random.integers(0, 6, n) == 0))
+        survivors = numpy.flatnonzero(self.life[:n] > 0)
+        if len(survivors) != n:
+            for name in self.fields:
+                array = getattr(self, name)
+                array[:len(survivors)] = array[survivors]
+            self.count = len(survivors)
+
+    def draw(self):
+        """Rasterizes all fire into the buffer, returns the rect of the buffer that was drawn on"""
+        n = self.count
+        pixels = pygame.surfarray.pixels2d(self.surface)
+        if self.box:
+            left, top, right, bottom = self.box
+            pixels[left:right, top:bottom] = self.transparent
+        self.box = None
+        if n:
+            life, max_life, radius = self.life[:n], self.max_life[:n], self.radius[:n]
+            stage = numpy.minimum((life * 6 / max_life).astype(numpy.int32), 5)
+            x = (self.x[:n] + self.ox[:n] * (5 - stage)).astype(numpy.int32)
+            y = (self.y[:n] + self.oy[:n] * (5 - stage)).astype(numpy.int32)
+            self.box = stamp(pixels, CIRCLE, x, y, radius.astype(numpy.int32), self.mapped_colors[stage])
+            shake = self.random.integers(-1, 2, n)
+            core = stage > 0
+            core_box = stamp(pixels, CIRCLE, x[core] + shake[core], y[core] - 3,
+                             (radius[core] / 1.5).astype(numpy.int32), self.mapped_colors[stage[core] - 1])
+            self.box = union_box(self.box, core_box)
+            tip = ~core
+            tip_radius = radius[tip] * ((max_life[tip] - life[tip]) / max_life[tip]) / 0.88
+            stamp(pixels, CIRCLE, x[tip] + shake[tip], y[tip] - 4, tip_radius.astype(numpy.int32),
+                  numpy.full(tip.sum(), self.transparent, dtype=numpy.uint32))
+        del pixels
+        return box_to_rect(self.box) if self.box else None
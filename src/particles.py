@@ -1,211 +1,101 @@
 import pygame
 import random
-from math import sin
 import math
 import src.utils as utils
-import time
-from src.objects.coin import Bounce
 from src.objects.hole import Hole
+from src.particle_engine import ParticleEngine, FireSystem
 
 
 class Particle:
+    """Describes a single particle, ParticleManager copies its attributes into the ParticleEngine arrays"""
+    shape = 'circle'  # 'circle' or 'rect'
+    colors = ((255, 255, 255),)  # one is chosen at random every frame
+    room = None  # room on whose map particle is drawn, None for current map
+    size = 0  # side of rect particles
+    radius = 0
+    radius_decay = 0
+    life = 1
+    life_decay = 0
+    jitter = ((0, 0), (0, 0))  # ranges of random x and y offsets added every frame
+    jitter_scale = 1
+    step_chance = 1  # chance of particle moving and ageing in a frame
+    drift = 0  # moves particle against player's horizontal movement
+    vx = vy = 0  # velocity per engine substep
+    gravity = 0
+    drag = 1
+
     def __init__(self, game, x, y):
         self.game = game
         self.x = x
         self.y = y
-        self.life = None  # how long should particle live(frames)
 
 
 class EnemyHitParticle(Particle):
-    color = (255, 0, 0)
+    colors = ((255, 0, 0),)
     radius = random.randint(3, 8)
-
-    def update(self):
-        self.x += random.randint(-1, 1)
-        self.y += random.randint(-1, 1)
-        self.radius -= 0.20
-        if self.radius <= 0:
-            self.game.particle_manager.particle_list.remove(self)
-
-    def draw(self, surface):
-        pygame.draw.circle(surface, self.color, (self.x, self.y), self.radius)
+    radius_decay = 0.2
+    jitter = ((-1, 1), (-1, 1))
 
 
 class WallHitParticle(Particle):
-    def __init__(self, game, x, y):
-        super().__init__(game, x, y)
-        self.color = (128, 148, 171)
-        self.radius = 10
-
-    def update(self):
-        self.x += random.randint(-1, 1)
-        self.y += random.randint(-1, 1)
-        self.radius -= 0.7
-
-        if self.radius <= 0:
-            self.game.particle_manager.particle_list.remove(self)
-
-    def draw(self, surface):
-        pygame.draw.circle(surface, self.color, (self.x, self.y), self.radius)
+    colors = ((128, 148, 171),)
+    radius = 10
+    radius_decay = 0.7
+    jitter = ((-1, 1), (-1, 1))
 
 
 class Fire(Particle):
-    """Besides some calculations and magic variables, there is a bsurf Surface in game class, which serves as screen
-    to display fire plarticles, it is 4x times smaller than default window, but during blitting, it is resized to
-    window size, as to achieve pixelated fire)"""
+    """Describes a fire particle for FireSystem, coordinates are in the quarter resolution fire buffer"""
 
     def __init__(self, game, x, y, option='normal'):
         super().__init__(game, x, y)
-        self.color = ((255, 255, 0),
-                      (255, 173, 51),
-                      (247, 117, 33),
-                      (191, 74, 46),
-                      (115, 61, 56),
-                      (61, 38, 48))
         if option == 'normal':
             self.max_life = random.randint(6, 13)
-            self.life = self.max_life
-            self.sin = random.randint(-10, 10) / 7
-            self.sin_r = random.randint(5, 10)
             self.radius = random.randint(0, 4)
-            self.ox = random.randint(-1, 1)
-            self.oy = random.randint(-1, 1)
-            self.j = random.randint(0, 360)
-            self.i = int(((self.life - 1) / self.max_life) * 6)
-            self.alpha = None
         elif option == 'enemy':
             self.max_life = random.randint(6, 9)
-            self.life = self.max_life
-            self.sin = random.randint(-10, 10) / 7
-            self.sin_r = random.randint(5, 10)
             self.radius = random.randint(0, 2)
-            self.ox = random.randint(-1, 1)
-            self.oy = random.randint(-1, 1)
-            self.j = random.randint(0, 360)
-            self.i = int(((self.life - 1) / self.max_life) * 6)
-            self.alpha = None
-        self.draw_x = x
-        self.draw_y = y
-
-    def update(self):
-        if random.randint(1, 4) == 2:
-            if self.j > 360:  # Angle
-                self.j = 0
-            self.life -= 1
-            if self.life == 0:
-                self.game.particle_manager.fire_particles.remove(self)
-            self.i = int((self.life / self.max_life) * 6)
-            self.y -= 0.7  # rise
-            self.x += 0  # ((self.sin * sin(self.j / self.sin_r)) / 20)  # spread
-            if not random.randint(0, 5):
-                self.radius += 0.2  # circle radius, set to 10 for big bang
-            self.draw_x, self.draw_y = self.x, self.y
-            self.draw_x += self.ox * (5 - self.i)
-            self.draw_y += self.oy * (5 - self.i)
-            self.alpha = 255
-            if self.life < self.max_life / 4:
-                self.alpha = int((self.life / self.max_life) * 255)
-
-    def draw(self, surface):
-        alpha = 255
-        pygame.draw.circle(surface,
-                           self.color[self.i] + (alpha,),
-                           (self.draw_x, self.draw_y),
-                           self.radius, 0)
-        if self.i == 0:
-            pygame.draw.circle(surface,
-                               (0, 0, 0, 0),
-                               (self.draw_x + random.randint(-1, 1),
-                                self.draw_y - 4),
-                               self.radius * (((self.max_life - self.life) / self.max_life) / 0.88), 0)
-        else:
-            pygame.draw.circle(surface,
-                               self.color[self.i - 1] + (alpha,),
-                               (self.draw_x + random.randint(-1, 1), self.draw_y - 3),
-                               self.radius / 1.5, 0)
+        self.life = self.max_life
+        self.ox = random.randint(-1, 1)
+        self.oy = random.randint(-1, 1)
 
 
 class ChestParticle(Particle):
+    shape = 'rect'
+    colors = ((232, 209, 58), (255, 255, 255), (232, 67, 58))
+    size = 8
+    life_decay = 0.15
+    jitter = ((-8, 8), (-8, -2))
+    step_chance = 1 / 7
+
     def __init__(self, game, x, y, chest):
         super().__init__(game, x, y)
-        self.color = [(232, 209, 58, 125), (255, 255, 255, 124), (232, 67, 58, 125)]
-        self.radius = 4
-        self.life = 1
-        self.counter = 0
-        self.chest = chest
-        # self.surface = pygame.Surface((64, 128)).convert_alpha()
-
-    def update(self):
-        if random.randint(0, 6) == 5:
-            self.x += random.randint(-8, 8)
-            self.y += random.randint(-8, -2)
-            self.life -= 0.15
-        if self.life <= 0:
-            self.game.particle_manager.particle_list.remove(self)
-
-    def draw(self, surface=None):
-        color = random.choice(self.color)
-        base_surface = self.chest.room.tile_map.map_surface
-        pygame.draw.rect(base_surface, color, (self.x, self.y, 8, 8))
-
-
-class Bounce:
-    def __init__(self, x, y):
-        self.speed = random.uniform(0.5, 0.6)  # 0.5
-        self.angle = random.randint(-10, 10) / 10  # random.choice([10, -10])
-        self.drag = 0.999
-        self.elasticity = random.uniform(0.75, 0.9)  # 0.75
-        self.gravity = (math.pi, 0.002)
-        self.x, self.y = x, y
-
-    @staticmethod
-    def add_vectors(angle1, length1, angle2, length2):
-        x = math.sin(angle1) * length1 + math.sin(angle2) * length2
-        y = math.cos(angle1) * length1 + math.cos(angle2) * length2
-        angle = 0.5 * math.pi - math.atan2(y, x)
-        length = math.hypot(x, y)
-        return angle, length
-
-    def move(self):
-        self.angle, self.speed = self.add_vectors(self.angle, self.speed, *self.gravity)
-        self.x += math.sin(self.angle) * self.speed
-        self.y -= math.cos(self.angle) * self.speed
-        self.speed *= self.drag
+        self.room = chest.room
 
 
 class PowerUpParticle(Particle):
+    shape = 'rect'
+    colors = ((255, 21, 121),)
+    size = 8
+    life = 20
+    life_decay = 1
+    gravity = 0.002
+    drag = 0.999
+
     def __init__(self, game, x, y):
         super().__init__(game, x, y)
-        self.color = [(255, 21, 121)]
-        self.radius = 4
-        self.life = 20
-        self.counter = 0
-        self.bounce = Bounce(self.x, self.y)
-
-    def update(self):
-        self.life -= 1
-        for _ in range(5):
-            self.bounce.move()
-        self.x = self.bounce.x
-        self.y = self.bounce.y
-        if self.life <= 0:
-            self.game.particle_manager.particle_list.remove(self)
-
-    def draw(self, surface):
-        color = random.choice(self.color)
-        pygame.draw.rect(surface, color, (self.x, self.y, 8, 8))
+        speed = random.uniform(0.5, 0.6)
+        angle = random.randint(-10, 10) / 10
+        self.vx = math.sin(angle) * speed
+        self.vy = -math.cos(angle) * speed
 
 
 class PowerUpAttackParticle(PowerUpParticle):
-    def __init__(self, game, x, y):
-        super().__init__(game, x, y)
-        self.color = [(255, 21, 121), (255, 111, 204)]
+    colors = ((255, 21, 121), (255, 111, 204))
 
 
 class ShieldParticle(PowerUpParticle):
-    def __init__(self, game, x, y):
-        super().__init__(game, x, y)
-        self.color = [(3, 188, 139), (11, 144, 141)]
+    colors = ((3, 188, 139), (11, 144, 141))
 
 
 class DeathAnimation:
@@ -220,9 +110,8 @@ class DeathAnimation:
 
     def load_images(self):
         for i in range(12):
-            self.images.append(pygame.image.load(f'./assets/misc/death/death{i + 1}.png').convert_alpha())
-            if self.entity.name == 'boss':
-                self.images[-1] = pygame.transform.scale(self.images[-1], (192, 192))
+            size = (192, 192) if self.entity.name == 'boss' else None
+            self.images.append(utils.load_image(f'./assets/misc/death/death{i + 1}.png', size))
 
     def update(self):
         self.counter += 0.3
@@ -233,90 +122,74 @@ class DeathAnimation:
                 self.entity.room.objects.append(Hole(self.game, position, self.entity.room))
 
     def draw(self, surface):
-        surface.blit(self.images[int(self.counter)], (self.x, self.y))
+        return surface.blit(self.images[int(self.counter)], (self.x, self.y))
+
 
 
 class StaffParticle(Particle):
     colors = ((151, 218, 63), (140, 218, 63), (160, 218, 63))
     radius = random.randint(7, 8)
+    radius_decay = 0.2
+    jitter = ((-1, 1), (-1, 1))
 
     def __init__(self, game, x, y, room):
         super().__init__(game, x, y)
         self.room = room
 
-    def update(self):
-        self.x += random.randint(-1, 1)
-        self.y += random.randint(-1, 1)
-        self.radius -= 0.20
-        if self.radius <= 0:
-            self.game.particle_manager.particle_list.remove(self)
-
-    def draw(self, surface):
-        color = random.choice(self.colors)
-        surface = self.room.tile_map.map_surface
-        pygame.draw.circle(surface, color, (self.x, self.y), self.radius)
-
 
 class Dust(Particle):
+    shape = 'rect'
+    colors = ((173, 173, 172),)
+    size = 5
+    life_decay = 0.5
+    jitter = ((0, 0), (-3, 2))
+    jitter_scale = 0.25
+    drift = 0.25
+
     def __init__(self, game, player, x, y):
         super().__init__(game, x, y)
         self.player = player
-        self.x = x
-        self.y = y
-        self.color = pygame.Color(173, 173, 172, 0)
         self.life = random.randint(4, 5)
         if random.randint(1, 8) % 4 != 0:
             self.life = 0
 
-    def update(self):
-        # if self.player.velocity:
-        if self.player.velocity[0] > 0:
-            self.x -= random.randint(1, 2) / 4
-        elif self.player.velocity[0] < 0:
-            self.x += random.randint(1, 2) / 4
-        self.y -= random.randint(-2, 3) / 4
-        self.life -= 0.5
-        if self.life <= 0:
-            self.game.particle_manager.particle_list.remove(self)
-
-    def draw(self, surface):
-        if self.player.velocity:
-            rect = (self.x, self.y, 5, 5)
-            pygame.draw.rect(surface, self.color, rect)
-
 
 class ParticleManager:
     def __init__(self, game):
         self.game = game
-        self.particle_list = []
-        self.fire_particles = []
-        # self.surface = self.game.screen
+        self.particle_engine = ParticleEngine()
+        self.particle_list = []  # particles drawn from images, like DeathAnimation
         self.surface = pygame.Surface((utils.world_size[0] // 4, utils.world_size[1] // 4),
                                       pygame.SRCALPHA).convert_alpha()
-        self.dest_surf = pygame.Surface((utils.world_size[0], utils.world_size[1])).convert_alpha()
+        self.fire_system = FireSystem(self.surface)
 
     def update_particles(self):
-        if self.particle_list:
-            for particle in self.particle_list:
-                particle.update()
+        self.particle_engine.update(self.game.player.velocity[0])
+        for particle in self.particle_list:
+            particle.update()
 
     def update_fire_particles(self):
-        for p in self.fire_particles:
-            p.update()
+        self.fire_system.update()
 
     def draw_fire_particles(self):
-        self.surface.fill((0, 0, 0, 0))
-        for p in self.fire_particles:
-            p.draw(self.surface)
-        s = self.game.world_manager.current_map.map_surface
-        s.blit(pygame.transform.scale(self.surface, (utils.world_size[0], utils.world_size[1]), self.dest_surf), (0, 0))
+        fire_rect = self.fire_system.draw()
+        if not fire_rect:
+            return
+        # only the part of the buffer covered by fire is scaled up and blitted onto the map
+        tile_map = self.game.world_manager.current_map
+        scaled = pygame.transform.scale(self.surface.subsurface(fire_rect), (fire_rect.width * 4, fire_rect.height * 4))
+        tile_map.add_dirty_rect(tile_map.map_surface.blit(scaled, (fire_rect.x * 4, fire_rect.y * 4)))
 
     def add_particle(self, particle):
-        self.particle_list.append(particle)
+        if isinstance(particle, Particle):
+            self.particle_engine.emit(particle)
+        else:
+            self.particle_list.append(particle)
 
     def add_fire_particle(self, particle):
-        self.fire_particles.append(particle)
+        self.fire_system.emit(particle)
 
-    def draw_particles(self, surface):
+    def draw_particles(self, tile_map):
+        self.particle_engine.draw(tile_map)
         for particle in self.particle_list:
-            particle.draw(surface)
+            tile_map.add_dirty_rect(particle.draw(tile_map.map_surface))
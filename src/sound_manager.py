@@ -3,75 +3,144 @@ import random
 
 
 class SoundManager:
+    """Sound bank, every effect is decoded once and played by name"""
+    categories = {'combat': 8, 'player': 3, 'items': 4, 'world': 3}  # category: channels reserved for it
+    sound_files = {  # name: (path, volume, category, max concurrent voices, cooldown in ms)
+        'coin': ('./assets/objects/coin/sound/Pickup Coin.wav', 0.3, 'items', 3, 30),
+        'walk': ('./assets/sound/walk.wav', 0.8, 'player', 1, 350),
+        'drop': ('./assets/sound/Click3.wav', 0.15, 'items', 2, 0),
+        'sword': ('./assets/sound/sword.wav', 0.3, 'combat', 1, 350),
+        'fire': ('./assets/sound/Fire.wav', 0.3, 'combat', 1, 350),
+        'hit': ('./assets/sound/Hit.wav', 0.6, 'combat', 3, 25),
+        'bounce': ('./assets/sound/Hit.wav', 1, 'combat', 2, 25),
+        'get_item': ('./assets/sound/get_item.wav', 1, 'items', 1, 0),
+        'drop_items': ('./assets/sound/Explosion2.wav', 1, 'items', 2, 0),
+        'passage': ('./assets/sound/passage.wav', 1, 'world', 1, 0),
+        'player_hurt': ('./assets/sound/Impact4.wav', 1, 'player', 1, 0),
+        'boss_bullet': ('./assets/sound/Click6.wav', 0.2, 'combat', 3, 30),
+        'bullet_impact': ('./assets/sound/Impact5.wav', 1, 'combat', 3, 30),
+        'boss_circle_shoot': ('./assets/sound/Impact1.wav', 1, 'combat', 1, 0),
+        'imp_shoot': ('./assets/sound/Shoot5.wav', 1, 'combat', 3, 30),
+        'staff_shoot': ('./assets/sound/Shoot6.wav', 1, 'combat', 2, 0),
+        'power_up': ('./assets/sound/PowerUp.wav', 1, 'items', 1, 0),
+        'hole': ('./assets/sound/Explosion3.wav', 1, 'world', 1, 0),
+        'chest': ('./assets/sound/Magic1.wav', 1, 'items', 1, 0),
+        'fall': ('./assets/sound/Random1.wav', 1, 'player', 1, 0),
+        'intro': ('./assets/sound/Intro.wav', 1, 'world', 1, 0),
+        'menu_select': ('./assets/sound/menu select.wav', 1, 'world', 1, 0),
+        'game_over': ('./assets/sound/GameOver2.wav', 1, 'world', 1, 0),
+    }
+    sounds = {}  # name: pygame.mixer.Sound, shared between games so refresh does not decode them again
+    music_files = ('./assets/sound/dungeon_theme_1.wav',)  # level themes, streamed by pygame.mixer.music
+    music_fade = 1500  # ms
+    current_music = None  # kept on the class, so music keeps playing through Game.refresh
+    next_music = None
+
     def __init__(self, game):
         self.game = game
-        self.coin_sound = None
-        self.load_coin_sound()
-        self.walk_sound = None
-        self.load_walk_sound()
-        self.walk_sound_cooldown = 250
-        self.drop_sound = pygame.mixer.Sound('./assets/sound/Click3.wav')
-        self.drop_sound.set_volume(0.15)
-        self.sword_slash = pygame.mixer.Sound('./assets/sound/sword.wav')
-        self.sword_slash.set_volume(0.3)
-        self.fire_slash = pygame.mixer.Sound('./assets/sound/Fire.wav')
-        self.fire_slash.set_volume(0.3)
-        self.sword_slash_cooldown = 0
-        self.hit_sound = pygame.mixer.Sound('./assets/sound/Hit.wav')
-        self.hit_sound.set_volume(0.6)
-        self.hit_cd = 0
-        self.get_item = pygame.mixer.Sound('./assets/sound/get_item.wav')
-        self.drop_items = pygame.mixer.Sound('./assets/sound/Explosion2.wav')
-        self.passage = pygame.mixer.Sound('./assets/sound/passage.wav')
-        self.passage.set_volume(1)
-        self.player_hurt = pygame.mixer.Sound('./assets/sound/Impact4.wav')
-        self.boss_bullet = pygame.mixer.Sound('./assets/sound/Click6.wav')
-        self.boss_bullet.set_volume(0.2)
-
-    def load_coin_sound(self):
-        self.coin_sound = pygame.mixer.Sound('./assets/objects/coin/sound/Pickup Coin.wav')
-        self.coin_sound.set_volume(0.3)
-
-    def play(self, sound):
-        pygame.mixer.Sound.play(sound)
-
-    def load_walk_sound(self):
-        self.walk_sound = pygame.mixer.Sound('./assets/sound/walk.wav')
-        self.walk_sound.set_volume(0.8)
+        self.load_sounds()
+        self.channels = {}  # category: reserved channels
+        self.voices = {}  # channel: (name, start time) of the sound it plays
+        self.last_played = {}  # name: time it was last started
+        self.played_this_frame = set()
+        self.reserve_channels()
+
+    @classmethod
+    def load_sounds(cls):
+        """Loads every sound file once, names using the same file and volume share one Sound"""
+        loaded = {}
+        for name, (path, volume, *_) in cls.sound_files.items():
+            if name in cls.sounds:
+                continue
+            if (path, volume) not in loaded:
+                loaded[path, volume] = pygame.mixer.Sound(path)
+                loaded[path, volume].set_volume(volume)
+            cls.sounds[name] = loaded[path, volume]
+
+    def get(self, name):
+        return self.sounds[name]
+
+    def reserve_channels(self):
+        """Reserves the first channels for categories, so automatic playback never takes them"""
+        total = sum(self.categories.values())
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), total + 8))
+        pygame.mixer.set_reserved(total)
+        first = 0
+        for category, count in self.categories.items():
+            self.channels[category] = [pygame.mixer.Channel(first + i) for i in range(count)]
+            first += count
+
+    def update(self):
+        self.played_this_frame.clear()
+        self.update_music()
+
+    @classmethod
+    def play_level_music(cls, level):
+        cls.play_music(cls.music_files[(level - 1) % len(cls.music_files)])
+
+    @classmethod
+    def play_music(cls, path):
+        """Fades out the current track, the new one fades in from update_music once it is silent"""
+        if path == cls.current_music and pygame.mixer.music.get_busy():
+            return
+        cls.next_music = path
+        if pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(cls.music_fade)
+        else:
+            cls.update_music()
+
+    @classmethod
+    def update_music(cls):
+        if cls.next_music and not pygame.mixer.music.get_busy():
+            pygame.mixer.music.load(cls.next_music)
+            pygame.mixer.music.play(-1, fade_ms=cls.music_fade)
+            cls.current_music, cls.next_music = cls.next_music, None
+
+    def get_channel(self, name, category, limit):
+        """Free channel of the category, otherwise the one playing the oldest voice that may be stolen"""
+        channels = self.channels[category]
+        same = [channel for channel in channels if channel.get_busy() and self.voices.get(channel, ('',))[0] == name]
+        if len(same) >= limit:
+            return min(same, key=lambda channel: self.voices[channel][1])
+        for channel in channels:
+            if not channel.get_busy():
+                return channel
+        return min(channels, key=lambda channel: self.voices.get(channel, ('', 0))[1])
+
+    def play(self, name):
+        """Plays sound unless it was already started this frame or its cooldown has not passed yet"""
+        if name in self.played_this_frame:
+            return
+        path, volume, category, limit, cooldown = self.sound_files[name]
+        now = pygame.time.get_ticks()
+        if name in self.last_played and now - self.last_played[name] <= cooldown:
+            return
+        self.played_this_frame.add(name)
+        self.last_played[name] = now
+        channel = self.get_channel(name, category, limit)
+        channel.play(self.sounds[name])
+        self.voices[channel] = (name, now)
 
     def play_coin_sound(self):
-        pygame.mixer.Sound.play(self.coin_sound)
+        self.play('coin')
 
     def play_walk_sound(self):
-        if pygame.time.get_ticks() - self.walk_sound_cooldown > 350:
-            self.walk_sound_cooldown = pygame.time.get_ticks()
-            pygame.mixer.Sound.play(self.walk_sound)
+        self.play('walk')
 
     def play_drop_sound(self):
-        pygame.mixer.Sound.play(self.drop_sound)
+        self.play('drop')
 
     def play_sword_sound(self, type='sword'):
-        if (
-            type == 'fire'
-            and pygame.time.get_ticks() - self.sword_slash_cooldown > 350
-        ):
-            self.sword_slash_cooldown = pygame.time.get_ticks()
-            pygame.mixer.Sound.play(self.fire_slash)
-
-        elif pygame.time.get_ticks() - self.sword_slash_cooldown > 350:
-            self.sword_slash_cooldown = pygame.time.get_ticks()
-            pygame.mixer.Sound.play(self.sword_slash)
+        self.play('fire' if type == 'fire' else 'sword')
 
     def play_hit_sound(self):
-        if pygame.time.get_ticks() - self.hit_cd > 25:
-            self.hit_cd = pygame.time.get_ticks()
-            pygame.mixer.Sound.play(self.hit_sound)
+        self.play('hit')
 
     def play_get_item_sound(self):
-        pygame.mixer.Sound.play(self.get_item)
+        self.play('get_item')
 
     def play_drop_items_sound(self):
-        pygame.mixer.Sound.play(self.drop_items)
+        self.play('drop_items')
 
     def play_passage(self):
-        pygame.mixer.Sound.play(self.passage)
+        self.play('passage')
@@ -0,0 +1,30 @@
+class SpatialHash:
+    """Buckets objects by grid cells their rectangle overlaps, so only objects near a given rectangle are tested"""
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.cells = {}  # (column, row) -> list of (insertion order, object)
+        self.counter = 0
+
+    def clear(self):
+        self.cells.clear()
+        self.counter = 0
+
+    def get_cells(self, rect):
+        first_column, first_row = rect.left // self.cell_size, rect.top // self.cell_size
+        last_column, last_row = (rect.right - 1) // self.cell_size, (rect.bottom - 1) // self.cell_size
+        return [(column, row) for column in range(first_column, last_column + 1)
+                for row in range(first_row, last_row + 1)]
+
+    def insert(self, obj, rect):
+        for cell in self.get_cells(rect):
+            self.cells.setdefault(cell, []).append((self.counter, obj))
+        self.counter += 1
+
+    def query(self, rect):
+        """Returns objects from cells overlapped by rect, each once and in insertion order"""
+        found = {}
+        for cell in self.get_cells(rect):
+            for order, obj in self.cells.get(cell, ()):
+                found[order] = obj
+        return [found[order] for order in sorted(found)]
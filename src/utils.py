@@ -1,10 +1,11 @@
 import csv
+import weakref
 # world_size = namedtuple('Size', ['width','length'])
 import os
 import pygame
 import sys
 
-from collections import namedtuple
+from collections import namedtuple, OrderedDict
 
 world_size = (21 * 64, 14 * 64)
 BLACK = (0, 0, 0)
@@ -50,6 +51,84 @@ def get_mask_rect(surf, top=0, left=0):
         return surf_mask_rect
 
 
+mask_rects = weakref.WeakKeyDictionary()  # image -> its minimal bounding rectangle at (0, 0)
+masks = weakref.WeakKeyDictionary()  # image -> its mask
+
+
+def get_cached_mask_rect(surf, top=0, left=0):
+    """Returns minimal bounding rectangle of an image, mask is computed only once per image.
+    Use only for images that are not drawn on after loading (animation frames, object images)"""
+    if surf not in mask_rects:
+        mask_rects[surf] = get_mask_rect(surf)
+    surf_mask_rect = mask_rects[surf]
+    if surf_mask_rect is not None:
+        return surf_mask_rect.move(top, left)
+
+
+fonts = {}  # (path, size) -> pygame.font.Font
+rendered_texts = OrderedDict()  # (text, size, color, path) -> rendered surface, least recently used first
+max_rendered_texts = 256
+
+
+def get_font(size, path=font):
+    """Opens every font file only once per size"""
+    if (path, size) not in fonts:
+        fonts[path, size] = pygame.font.Font(path, size)
+    return fonts[path, size]
+
+
+def render_text(text, size, color=WHITE, path=font):
+    """Returns antialiased text surface, rendered only if it was not used recently.
+    Surface is shared, do not draw on it"""
+    key = (text, size, color, path)
+    if key in rendered_texts:
+        rendered_texts.move_to_end(key)
+        return rendered_texts[key]
+    text_surface = get_font(size, path).render(text, True, color)
+    rendered_texts[key] = text_surface
+    if len(rendered_texts) > max_rendered_texts:
+        rendered_texts.popitem(last=False)
+    return text_surface
+
+
+images = {}  # (path, size, flip) -> loaded image
+
+
+def load_image(path, size=None, flip=False):
+    """Loads, scales and converts an image only once. Returned surface is shared, do not draw on it"""
+    key = (path, tuple(size) if size else None, flip)
+    if key not in images:
+        image = pygame.image.load(path).convert_alpha()
+        if size:
+            image = pygame.transform.scale(image, size)
+        if flip:
+            image = pygame.transform.flip(image, True, False)
+        images[key] = image
+    return images[key]
+
+
+shadows = {}  # (dimension, ellipse) -> (shadow image, its offset)
+
+
+def get_shadow(ellipse, dimension=50):
+    """Semi transparent ellipse drawn on a dimension x dimension surface and scaled 2x, made only once per ellipse.
+    Returns the image cropped to the ellipse and its offset in the scaled surface"""
+    key = (dimension, tuple(pygame.Rect(ellipse)))
+    if key not in shadows:
+        shape_surf = pygame.Surface((dimension, dimension), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.ellipse(shape_surf, (0, 0, 0, 120), key[1])
+        shape_surf = pygame.transform.scale(shape_surf, (2 * dimension, 2 * dimension))
+        rect = shape_surf.get_bounding_rect()
+        shadows[key] = shape_surf.subsurface(rect).copy(), rect.topleft
+    return shadows[key]
+
+
+def draw_shadow(surface, position, ellipse, dimension=50):
+    """Blits cached shadow as if the whole scaled surface was blitted at position, returns the drawn rect"""
+    shadow, offset = get_shadow(ellipse, dimension)
+    return surface.blit(shadow, (position[0] + offset[0], position[1] + offset[1]))
+
+
 def wait(mil_sec, game):
     ticks = mil_sec / 16
     if game.counter == game.counter + ticks:
@@ -60,3 +139,10 @@ def time_passed(time, amount):
     if pygame.time.get_ticks() - time > amount:
         time = pygame.time.get_ticks()
         return True
+
+
+def get_cached_mask(surf):
+    """Returns mask of an image, computed only once per image"""
+    if surf not in masks:
+        masks[surf] = pygame.mask.from_surface(surf)
+    return masks[surf]